@@ -6,7 +6,6 @@ from __future__ import annotations
 
 import pprint
 import re
-from subprocess import CalledProcessError
 from typing import TYPE_CHECKING, Any
 
 from lldb import (
@@ -20,7 +19,6 @@ from lldb import (
 
 import plotrc
 import pyrc
-from pyrc import Parser
 
 if TYPE_CHECKING:
     from collections.abc import Callable
@@ -52,83 +50,75 @@ RS_ARR_RE = (
 )
 
 
-def cmd_nushell(
-    debugger: SBDebugger,
-    command: str,
-    exe_ctx: SBExecutionContext,
-    result: SBCommandReturnObject,
-    internal_dict: dict,
-) -> None:
-    """Execute Nushell expression or start interactive session."""
-    frame = curframe(debugger)
-    line = pyrc.parse_exprs(var_lookup(frame), command)
-    parser = Parser()
-    parser.add_argument("-c", "--cwd", default=None)
-    cmd, args = parser.parse_line(line)
-    try:
-        pyrc.nushell(cmd, cwd=args.cwd)
-    except (CalledProcessError, FileNotFoundError) as exception:
-        result.SetError(str(exception))
-        result.SetStatus(eReturnStatusFailed)
-
-
-def cmd_py(
-    debugger: SBDebugger,
-    command: str,
-    exe_ctx: SBExecutionContext,
-    result: SBCommandReturnObject,
-    internal_dict: dict,
-) -> None:
+def binding(command: pyrc.Command) -> Callable[..., None]:
+    """Create LLDB command function for a debugger command."""
+
+    def function(
+        debugger: SBDebugger,
+        line: str,
+        exe_ctx: SBExecutionContext,
+        result: SBCommandReturnObject,
+        internal_dict: dict,
+    ) -> None:
+        try:
+            command.run(debugger, line, var_lookup(curframe(debugger)))
+        except Exception as exception:  # noqa: BLE001
+            result.SetError(str(exception))
+            result.SetStatus(eReturnStatusFailed)
+
+    function.__doc__ = command.handler.__doc__
+    function.__name__ = f"run_{command.name}"
+    return function
+
+
+@pyrc.command("py", debuggers=["lldb"])
+def cmd_py(debugger: SBDebugger, command: str, _args: None) -> None:
     """Execute Python expression with frame variables."""
     frame = curframe(debugger)
-    try:
-        eval(  # noqa: S307
-            command,
-            {
-                "aplay": pyrc.aplay,
-                "arec": pyrc.arec,
-                "cat": pyrc.cat,
-                "decibel": pyrc.decibel,
-                "doc": pyrc.doc,
-                "dyport": pyrc.dyport,
-                "edit": pyrc.edit,
-                "normalize": pyrc.normalize,
-                "nushell": pyrc.nushell,
-                "page": pyrc.page,
-                "pfreq": plotrc.frequency,
-                "pgrid": plotrc.grid,
-                "phase": plotrc.phase,
-                "pline": plotrc.line,
-                "plotrc": plotrc,
-                "pprint": pprint.pprint,
-                "pspec": plotrc.spectrogram,
-                "pwave": plotrc.waveform,
-                "shell": pyrc.shell,
-                "varname": pyrc.varname,
-            },
-            pyrc.find_vars(var_lookup(frame), command),
-        )
-    except Exception as exception:  # noqa: BLE001
-        result.SetError(str(exception))
-        result.SetStatus(eReturnStatusFailed)
-
-
-def cmd_pytype(
-    debugger: SBDebugger,
-    command: str,
-    exe_ctx: SBExecutionContext,
-    result: SBCommandReturnObject,
-    internal_dict: dict,
-) -> None:
+    eval(  # noqa: S307
+        command,
+        {
+            "aplay": pyrc.aplay,
+            "apropos": pyrc.apropos,
+            "aread": pyrc.aread,
+            "arec": pyrc.arec,
+            "astream": pyrc.astream,
+            "awrite": pyrc.awrite,
+            "cat": pyrc.cat,
+            "decibel": pyrc.decibel,
+            "doc": pyrc.doc,
+            "dyport": pyrc.dyport,
+            "dyport_many": pyrc.dyport_many,
+            "edit": pyrc.edit,
+            "normalize": pyrc.normalize,
+            "nushell": pyrc.nushell,
+            "page": pyrc.page,
+            "pfreq": plotrc.frequency,
+            "pgrid": plotrc.grid,
+            "phase": plotrc.phase,
+            "pline": plotrc.line,
+            "plotrc": plotrc,
+            "pprint": pprint.pprint,
+            "pspec": plotrc.spectrogram,
+            "pwave": plotrc.waveform,
+            "shell": pyrc.shell,
+            "size": pyrc.size,
+            "varname": pyrc.varname,
+        },
+        pyrc.find_vars(var_lookup(frame), command),
+    )
+
+
+@pyrc.command("pytype", debuggers=["lldb"])
+def cmd_pytype(debugger: SBDebugger, command: str, _args: None) -> None:
     """Print variable type as it appears to Python."""
     name = command.strip()
     frame = curframe(debugger)
     variable = frame.FindVariable(name)
-    if variable.error.success:
-        print(variable.type.name)
-    else:
-        result.SetError(f"Unable to find variable '{name}'.")
-        result.SetStatus(eReturnStatusFailed)
+    if not variable.error.success:
+        msg = f"Unable to find variable '{name}'."
+        raise LookupError(msg)
+    print(variable.type.name)
 
 
 def curframe(debugger: SBDebugger) -> SBFrame:
@@ -183,18 +173,18 @@ def var_lookup(frame: SBFrame) -> Callable[[str], Any]:
 
 def __lldb_init_module(debugger: SBDebugger, internal_dict: dict) -> None:
     """LLDB entrypoint for customization."""
+    pyrc.warmup()
     result = SBCommandReturnObject()
     interpreter = debugger.GetCommandInterpreter()
 
-    interpreter.HandleCommand(
-        "command script add --function lldbrc.cmd_nushell nu",
-        result,
-    )
-    interpreter.HandleCommand(
-        "command script add --function lldbrc.cmd_py py",
-        result,
-    )
-    interpreter.HandleCommand(
-        "command script add --function lldbrc.cmd_pytype pytype",
-        result,
-    )
+    for command in pyrc.COMMANDS.values():
+        if "lldb" not in command.debuggers:
+            continue
+        # LLDB finds command functions by their module path.
+        function = binding(command)
+        globals()[function.__name__] = function
+        for name in (command.name, *command.aliases):
+            interpreter.HandleCommand(
+                f"command script add --function lldbrc.{function.__name__} {name}",
+                result,
+            )
@@ -8,18 +8,33 @@ from __future__ import annotations
 import os
 import shlex
 import traceback
-from subprocess import CalledProcessError
 from typing import TYPE_CHECKING, Any, Union, cast, no_type_check
 
 import plotrc
 import pyrc
 
 if TYPE_CHECKING:
+    from argparse import Namespace
     from collections.abc import Callable
     from pdb import Pdb
     from types import FrameType, TracebackType
 
 
+def binding(command: pyrc.Command) -> Callable[[Pdb, str], Any]:
+    """Create PDB method for a debugger command."""
+
+    def method(self: Pdb, line: str) -> Any:  # noqa: ANN401
+        try:
+            return command.run(self, line, var_lookup(self))
+        except Exception as exception:
+            error(exception)
+            return None
+
+    method.__doc__ = command.handler.__doc__
+    method.__name__ = f"do_{command.name}"
+    return method
+
+
 def break_exception(self: Pdb) -> Callable:
     """Create exception handler for debugging."""
 
@@ -33,64 +48,58 @@ def break_exception(self: Pdb) -> Callable:
     return excepthook
 
 
-def curframe(pdb: Pdb) -> FrameType:
-    """Attribute accessor wrapper to satisfy type checkers."""
-    return cast("FrameType", pdb.curframe)
+@pyrc.command("apropos", debuggers=["pdb"])
+def cmd_apropos(_self: Pdb, line: str, _args: None) -> None:
+    """apropos <query>
+
+    Search documentation of loaded and installed modules.
+    """
+    pyrc.apropos(line)
 
 
-def do_cat(self: Pdb, line: str) -> None:
+@pyrc.command(
+    "cat",
+    arguments=[(["-r", "--regex"], {"default": None})],
+    complete=True,
+    debuggers=["pdb"],
+)
+def cmd_cat(self: Pdb, line: str, args: Namespace) -> None:
     """cat -r, --regex <regex> object
 
     Print object catalog with default pager.
     """
-    parser = pyrc.Parser()
-    parser.add_argument("-r", "--regex", default=None)
-    rest, args = parser.parse_line(line)
-
-    try:
-        object_ = parse(self, rest)
-        pyrc.cat(object_, regex=args.regex)
-    except Exception as exception:
-        error(exception)
-        return
+    pyrc.cat(parse(self, line), regex=args.regex)
 
 
-def do_doc(self: Pdb, line: str) -> None:
+@pyrc.command("doc", complete=True, debuggers=["pdb"])
+def cmd_doc(self: Pdb, line: str, _args: None) -> None:
     """doc [object]
 
     Print object signature and documentation in default pager.
     """
-    try:
-        object_ = parse(self, line)
-    except Exception as exception:
-        error(exception)
-        return
-
+    object_ = parse(self, line)
     if object_ is None:
         try:
             docstring = curframe(self).f_globals["__doc__"]
         except KeyError:
-            error("Unable to find current module docstring")
-        else:
-            pyrc.cat(docstring)
+            msg = "Unable to find current module docstring"
+            raise LookupError(msg) from None
+        pyrc.cat(docstring)
     else:
         pyrc.doc(object_)
 
 
-def do_edit(self: Pdb, line: str) -> None:
+@pyrc.command("edit", complete=True, debuggers=["pdb"])
+def cmd_edit(self: Pdb, line: str, _args: None) -> None:
     """ed(it) [object]
 
     Open object source code or current module in default text editor.
     """
-    try:
-        object_ = parse(self, line)
-    except Exception as exception:
-        error(exception)
-    else:
-        pyrc.edit(object_, curframe(self))
+    pyrc.edit(parse(self, line), curframe(self))
 
 
-def do_nextlist(self: Pdb, _arg: str) -> int:
+@pyrc.command("nextlist", "nl", debuggers=["pdb"])
+def cmd_nextlist(self: Pdb, _line: str, _args: None) -> int:
     """nl | nextlist
 
     Continue execution until the next line and then list source code.
@@ -101,45 +110,50 @@ def do_nextlist(self: Pdb, _arg: str) -> int:
     return 1
 
 
-def do_nushell(self: Pdb, line: str) -> None:
-    """nu(shell) -c, --cwd <path> [expression]
+@pyrc.command("shell", "sh", debuggers=["pdb"], interpolate=True)
+def cmd_shell(_self: Pdb, line: str, _args: None) -> None:
+    """sh(ell) [command]
 
-    Execute Nushell expression or start interactive session.
+    Execute command or start interactive default shell session.
     """
-    line_ = pyrc.parse_exprs(var_lookup(self), line)
-    parser = pyrc.Parser()
-    parser.add_argument("-c", "--cwd", default=None)
-    rest, args = parser.parse_line(line_)
-    try:
-        pyrc.nushell(rest, cwd=args.cwd)
-    except (CalledProcessError, FileNotFoundError) as exception:
-        error(exception)
+    arguments = list(map(str, map(os.path.expanduser, shlex.split(line.strip()))))
+    pyrc.shell(arguments)
 
 
-def do_shell(self: Pdb, line: str) -> None:
-    """sh(ell) [command]
+@pyrc.command(
+    "size",
+    arguments=[(["-r", "--regex"], {"default": None})],
+    complete=True,
+    debuggers=["pdb"],
+)
+def cmd_size(self: Pdb, line: str, args: Namespace) -> None:
+    """size -r, --regex <regex> [object]
 
-    Execute command or start interactive default shell session.
+    Print memory footprint of object attributes or frame variables.
     """
-    line_ = pyrc.parse_exprs(var_lookup(self), line)
-    arguments = list(map(str, map(os.path.expanduser, shlex.split(line_.strip()))))
-    try:
-        pyrc.shell(arguments)
-    except (CalledProcessError, FileNotFoundError) as exception:
-        error(exception)
+    object_ = parse(self, line)
+    if object_ is None:
+        object_ = dict(self.curframe_locals)
+    pyrc.size(object_, regex=args.regex)
 
 
-def do_steplist(self: Pdb, arg: str) -> int:
+@pyrc.command("steplist", "sl", debuggers=["pdb"])
+def cmd_steplist(self: Pdb, line: str, _args: None) -> int:
     """sl | steplist
 
     Execution current line and then list source code.
     """
     self.set_step()
-    self.do_list(arg)
+    self.do_list(line)
     # Returning "1" appears to be necessary for subsequent calls to work.
     return 1
 
 
+def curframe(pdb: Pdb) -> FrameType:
+    """Attribute accessor wrapper to satisfy type checkers."""
+    return cast("FrameType", pdb.curframe)
+
+
 def error(message: Union[str, Exception]) -> None:
     """Print error to console."""
     if isinstance(message, str):
@@ -160,21 +174,16 @@ def setup(pdb: Pdb) -> None:
     """Add custom commands to PDB."""
     plotrc.export()
     pyrc.export()
-
-    pdb.do_cat = do_cat
-    pdb.complete_cat = pdb._complete_expression
-    pdb.do_doc = do_doc
-    pdb.complete_doc = pdb._complete_expression
-    pdb.do_edit = do_edit
-    pdb.complete_edit = pdb._complete_expression
-    pdb.do_nl = do_nextlist
-    pdb.do_nextlist = do_nextlist
-    pdb.do_nu = do_nushell
-    pdb.do_nushell = do_nushell
-    pdb.do_sh = do_shell
-    pdb.do_shell = do_shell
-    pdb.do_sl = do_steplist
-    pdb.do_steplist = do_steplist
+    pyrc.warmup()
+
+    for command in pyrc.COMMANDS.values():
+        if "pdb" not in command.debuggers:
+            continue
+        method = binding(command)
+        for name in (command.name, *command.aliases):
+            setattr(pdb, f"do_{name}", method)
+            if command.complete:
+                setattr(pdb, f"complete_{name}", pdb._complete_expression)
 
 
 def var_lookup(pdb: Pdb) -> Callable[[str], Any]:
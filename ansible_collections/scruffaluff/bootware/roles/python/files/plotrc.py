@@ -1,13 +1,20 @@
 """Python plotting utilities."""
 
 # Explicit optional, union, and quoted types are used to support older Python versions.
-# ruff: noqa: PLR0913, PYI034, UP007, UP037, UP045
+# ruff: noqa: ANN401, PLR0913, PYI034, UP007, UP037, UP045
 
 from __future__ import annotations
 
 import builtins
 import dataclasses
+import fractions
+import functools
 import itertools
+import math
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
 from typing import TYPE_CHECKING, Any, Optional, Union, cast, no_type_check
 
@@ -15,10 +22,111 @@ import pyrc
 from pyrc import Array, dyport
 
 if TYPE_CHECKING:
-    from collections.abc import Iterable
+    from collections.abc import Callable, Iterable, Sequence
 
 Signal = Union[Array, tuple[Array, Array], dict[str, Any]]
 
+# Libraries for all plots are installed together to avoid several cold starts.
+DEPENDENCIES = ("matplotlib.pyplot", "numpy", "scipy.signal")
+
+# Number of evenly spaced samples hashed to detect changed array contents.
+FINGERPRINT_SAMPLES = 64
+
+# Memory limit of cached spectra in bytes.
+SPECTRUM_CACHE_BYTES = 256 * 2**20
+
+
+@dataclasses.dataclass(eq=False)
+class Decimator:
+    """Line point reducer that resamples data when axis limits change.
+
+    Full resolution data is kept, so zooming in reveals original samples and
+    drawing cost scales with axis width instead of signal length.
+    """
+
+    line: Any
+    x: Array
+    y: Array
+    method: str = "minmax"
+
+    def __post_init__(self) -> None:
+        """Check decimation method."""
+        if self.method not in {"lttb", "minmax"}:
+            msg = f"Unknown decimation method '{self.method}'."
+            raise ValueError(msg)
+
+    def __call__(self, axis: Any) -> None:
+        """Update line data for visible range and pixel width of axis."""
+        numpy = dyport("numpy")
+        start, stop = sorted(axis.get_xlim())
+        lower = max(int(numpy.searchsorted(self.x, start, side="left")) - 1, 0)
+        upper = int(numpy.searchsorted(self.x, stop, side="right")) + 1
+        width = max(1, round(axis.get_window_extent().width))
+        self.line.set_data(*self.resample(lower, upper, width))
+
+    def resample(self, lower: int, upper: int, width: int) -> tuple[Array, Array]:
+        """Reduce points between indices to about two per pixel column."""
+        x, y = self.x[lower:upper], self.y[lower:upper]
+        if self.method == "lttb":
+            return lttb(x, y, 2 * width)
+        return minmax(x, y, width)
+
+
+class Pyramid:
+    """Spectrogram image levels that are swapped to match the axis view.
+
+    Each level max pools pairs of time columns from the level below, so
+    zooming and panning draw about one column per pixel without recomputing
+    the spectrogram.
+    """
+
+    def __init__(self, image: Any, data: Array, minimum: int = 256) -> None:
+        """Create a new Pyramid instance."""
+        numpy = dyport("numpy")
+        self.extent = tuple(image.get_extent())
+        self.image = image
+        self.levels = [data]
+        self.updating = False
+        while self.levels[-1].shape[1] > minimum:
+            level = self.levels[-1]
+            even = level[:, : level.shape[1] // 2 * 2]
+            pooled = numpy.maximum(even[:, 0::2], even[:, 1::2])
+            if level.shape[1] % 2:
+                pooled = numpy.concatenate((pooled, level[:, -1:]), axis=1)
+            self.levels.append(pooled)
+
+    def __call__(self, axis: Any) -> None:
+        """Draw visible columns from the level matching the axis pixel width."""
+        if self.updating:
+            return
+        start, stop = sorted(axis.get_xlim())
+        left, right, bottom, top = self.extent
+        frames = self.levels[0].shape[1]
+        step = (right - left) / frames
+        lower = min(max(math.floor((start - left) / step), 0), frames - 1)
+        upper = min(max(math.ceil((stop - left) / step), lower + 1), frames)
+
+        width = max(1, axis.get_window_extent().width)
+        level = 0
+        while level + 1 < len(self.levels) and (upper - lower) >> level > 2 * width:
+            level += 1
+        scale = 2**level
+        first, last = lower // scale, -(-upper // scale)
+
+        self.updating = True
+        try:
+            self.image.set_data(self.levels[level][:, first:last])
+            self.image.set_extent(
+                (
+                    left + first * scale * step,
+                    min(left + last * scale * step, right),
+                    bottom,
+                    top,
+                )
+            )
+        finally:
+            self.updating = False
+
 
 @dataclasses.dataclass
 class Range:
@@ -53,7 +161,7 @@ class Scale(Enum):
         if self == Scale.Decibel:
             return pyrc.decibel(array)
         if self == Scale.FullScale:
-            return pyrc.decibel(pyrc.normalize(array))
+            return pyrc.decibel(array, reference=pyrc.peak(array) or 1.0)
         if self == Scale.Normalized:
             return pyrc.normalize(array)
         return array
@@ -99,6 +207,75 @@ class Scale(Enum):
         }[self]
 
 
+class SpectrumCache:
+    """Least recently used cache of real FFT spectra bounded by memory.
+
+    Spectra are keyed by array buffer address, layout, and a fingerprint of
+    sampled contents, so plots of the same array share one transform. Cached
+    spectra are read only since they are shared between callers.
+    """
+
+    def __init__(self, limit: int = SPECTRUM_CACHE_BYTES) -> None:
+        """Create a new SpectrumCache instance."""
+        self.entries: OrderedDict[tuple[Any, ...], Any] = OrderedDict()
+        self.limit = limit
+        self.lock = threading.Lock()
+        self.size = 0
+
+    def clear(self) -> None:
+        """Remove all cached spectra."""
+        with self.lock:
+            self.entries.clear()
+            self.size = 0
+
+    def key(self, array: Array) -> tuple[Any, ...]:
+        """Compute cache key for array without reading all of its contents."""
+        numpy = dyport("numpy")
+        array_ = cast("Any", array)
+        step = max(1, len(array_) // FINGERPRINT_SAMPLES)
+        sample = numpy.ascontiguousarray(array_[::step]).tobytes()
+        return (
+            array_.__array_interface__["data"][0],
+            array_.shape,
+            array_.strides,
+            array_.dtype.str,
+            hash(sample),
+        )
+
+    def rfft(self, array: Array) -> Array:
+        """Get real FFT of array from cache or compute and store it."""
+        numpy = dyport("numpy")
+        key = self.key(array)
+        with self.lock:
+            if key in self.entries:
+                self.entries.move_to_end(key)
+                return self.entries[key]
+
+        spectrum = numpy.fft.rfft(array)
+        spectrum.flags.writeable = False
+        if spectrum.nbytes > self.limit:
+            return spectrum
+        with self.lock:
+            if key not in self.entries:
+                self.entries[key] = spectrum
+                self.size += spectrum.nbytes
+            while self.size > self.limit:
+                _, evicted = self.entries.popitem(last=False)
+                self.size -= evicted.nbytes
+        return spectrum
+
+
+# Spectra shared by frequency, phase, and grid plots.
+SPECTRA = SpectrumCache()
+
+
+def channels_last(array: Array) -> Array:
+    """Orient 2 dimensional array with channels along columns without copying."""
+    if array.ndim == 2 and array.shape[0] < array.shape[1]:
+        return cast("Any", array).T
+    return array
+
+
 @no_type_check
 def export() -> None:
     """Add functions to global scope."""
@@ -110,18 +287,42 @@ def export() -> None:
     builtins.pwave = waveform
 
 
+@functools.lru_cache(maxsize=16)
+def frequencies(length: int, rate: float) -> Array:
+    """Compute read only real FFT sample frequencies."""
+    numpy = dyport("numpy")
+    array = numpy.fft.rfftfreq(length, 1 / rate)
+    array.flags.writeable = False
+    return array
+
+
 def frequency(
     *signals: Signal,
     axes: Optional[list[Any]] = None,
     depth: int = 3,
     overlay: bool = True,
+    method: str = "fft",
+    overlap: Optional[int] = None,
     rate: Optional[int] = None,
     scale: Scale = Scale.Linear,
+    segment: int = 4096,
     show: bool = True,
+    smooth: Optional[Union[str, float]] = None,
+    window: str = "hann",
+    workers: Optional[int] = None,
     x: Optional[Array] = None,
     **kwargs: Any,
 ) -> None:
-    """Plot audio frequency spectrum."""
+    """Plot audio frequency spectrum.
+
+    The "fft" method transforms each entire signal. The "welch" method
+    averages power over windowed segments of the given length and overlap,
+    which bounds memory by segment size and reduces noise for long signals.
+    Spectra are averaged into fractional octave bands if smooth is a fraction,
+    such as "1/3". Signals are transformed concurrently on up to workers
+    threads before drawing.
+    """
+    pyrc.prefetch(DEPENDENCIES)
     numpy, pyplot = dyport("numpy"), dyport("matplotlib.pyplot")
     overlay = kwargs.pop("o", overlay)
     rate = kwargs.pop("r", rate)
@@ -137,12 +338,33 @@ def frequency(
     axes[0].set_ylabel(f"Level{scale.unit()}")
     ticks = spectrum_ticks()
     x_range, y_range = Range(20, 20_000, True), Range()
-    datas = sigdata(signals, x=x, depth=depth)
+    datas = sigdata(
+        signals,
+        x=x,
+        depth=depth,
+        labels=kwargs.pop("labels", None),
+        downmix=method != "welch",
+    )
 
-    for index, data in enumerate(datas):
+    if method not in {"fft", "welch"}:
+        msg = f"Unknown spectrum method '{method}'."
+        raise ValueError(msg)
+
+    def compute(data: dict[str, Any]) -> tuple[Array, Array]:
         rate_ = rate or data.pop("rate", len(data["y"]))
-        y = scale(numpy.abs(numpy.fft.rfft(data["y"])))
-        x_ = data.pop("x", numpy.fft.rfftfreq(len(data["y"]), 1 / rate_))
+        if method == "welch":
+            x_, y = welch(data["y"], rate_, segment, overlap, window)
+            data.pop("x", None)
+        else:
+            y = numpy.abs(SPECTRA.rfft(data["y"]))
+            x_ = data.pop("x", frequencies(len(data["y"]), rate_))
+        if smooth is not None:
+            x_, power = octave_bins(x_, y**2, smooth)
+            y = numpy.sqrt(power)
+        return x_, scale(y)
+
+    results = parallel_map(compute, datas, workers)
+    for index, (data, (x_, y)) in enumerate(zip(datas, results, strict=True)):
         x_range += (x_[0], x_[-1])
         y_range += (y.min(), y.max())
 
@@ -164,6 +386,7 @@ def frequency(
 def grid(
     *signals: Signal,
     plots: list[str] | None = None,
+    depth: int = 3,
     overlay: bool = True,
     rate: Optional[int] = None,
     scale: Scale = Scale.Linear,
@@ -172,6 +395,7 @@ def grid(
     **kwargs: Any,
 ) -> None:
     """Plot multiple graphs vertically in a grid."""
+    pyrc.prefetch(DEPENDENCIES)
     pyplot = dyport("matplotlib.pyplot")
     overlay = kwargs.pop("o", overlay)
     plots = plots or kwargs.pop("p", ["frequency", "phase"])
@@ -189,7 +413,7 @@ def grid(
             line(
                 *signals,
                 axes=axes[idx],
-                depth=4,
+                depth=depth + 1,
                 overlay=overlay,
                 scale=scale,
                 show=False,
@@ -200,7 +424,7 @@ def grid(
             frequency(
                 *signals,
                 axes=axes[idx],
-                depth=4,
+                depth=depth + 1,
                 overlay=overlay,
                 rate=rate,
                 scale=scale,
@@ -212,7 +436,7 @@ def grid(
             phase(
                 *signals,
                 axes=axes[idx],
-                depth=4,
+                depth=depth + 1,
                 overlay=overlay,
                 rate=rate,
                 show=False,
@@ -221,13 +445,18 @@ def grid(
             )
         elif "spectrogram".startswith(plot):
             spectrogram(
-                *signals, axes=axes[idx], depth=4, rate=rate, show=False, **kwargs
+                *signals,
+                axes=axes[idx],
+                depth=depth + 1,
+                rate=rate,
+                show=False,
+                **kwargs,
             )
         elif "waveform".startswith(plot):
             waveform(
                 *signals,
                 axes=axes[idx],
-                depth=4,
+                depth=depth + 1,
                 overlay=overlay,
                 rate=rate,
                 scale=scale,
@@ -246,6 +475,7 @@ def grid(
 def line(
     *signals: Signal,
     axes: Optional[list[Any]] = None,
+    decimate: Optional[str] = "minmax",
     depth: int = 3,
     overlay: bool = True,
     scale: Scale = Scale.Linear,
@@ -253,7 +483,12 @@ def line(
     x: Optional[Array] = None,
     **kwargs: Any,
 ) -> None:
-    """Plot line."""
+    """Plot line.
+
+    Lines with increasing x values are decimated to the axis pixel width with
+    the "minmax" or "lttb" method, unless decimate is None.
+    """
+    pyrc.prefetch(DEPENDENCIES)
     numpy, pyplot = dyport("numpy"), dyport("matplotlib.pyplot")
     overlay = kwargs.pop("o", overlay)
     scale = Scale.from_prefix(kwargs.pop("s", scale))
@@ -266,7 +501,7 @@ def line(
         )
         axes = axes[0]
     x_range, y_range = Range(), Range()
-    datas = sigdata(signals, x=x, depth=depth)
+    datas = sigdata(signals, x=x, depth=depth, labels=kwargs.pop("labels", None))
 
     for index, data in enumerate(datas):
         x_ = data.pop("x", numpy.arange(len(data["y"])))
@@ -275,7 +510,7 @@ def line(
         y_range += (y.min(), y.max())
 
         axis = axes[0 if overlay else index]
-        axis.plot(x_, data["y"], color=data["color"], label=data["label"])
+        plot_decimated(axis, x_, y, decimate, color=data["color"], label=data["label"])
         axis.set_yscale(scale.axis())
         axis.legend(loc="upper right")
 
@@ -284,13 +519,125 @@ def line(
         pyplot.show(block=True)
 
 
+def lttb(x: Array, y: Array, count: int) -> tuple[Array, Array]:
+    """Downsample line with the largest triangle three buckets algorithm.
+
+    Channel columns of 2 dimensional y are averaged bucket by bucket.
+    """
+    numpy = dyport("numpy")
+    length = len(y)
+    if count < 3 or count >= length:
+        return x, mean_channels(y)
+
+    edges = numpy.linspace(1, length - 1, count - 1).astype(int)
+    indices = numpy.empty(count, dtype=int)
+    indices[0], indices[-1] = 0, length - 1
+    previous = 0
+    for bucket in range(count - 2):
+        start, stop = edges[bucket], edges[bucket + 1]
+        next_stop = edges[bucket + 2] if bucket + 2 < len(edges) else length
+        mean_x = x[stop:next_stop].mean()
+        mean_y = mean_channels(y[stop:next_stop]).mean()
+        y_previous = mean_channels(y[previous : previous + 1])[0]
+        areas = numpy.abs(
+            (x[previous] - mean_x) * (mean_channels(y[start:stop]) - y_previous)
+            - (x[previous] - x[start:stop]) * (mean_y - y_previous)
+        )
+        previous = start + int(areas.argmax())
+        indices[bucket + 1] = previous
+    return x[indices], mean_channels(y[indices])
+
+
+def mean_channels(block: Array) -> Array:
+    """Average channel columns of block into 1 dimension."""
+    return block if block.ndim == 1 else block.mean(axis=1)
+
+
+def mean_extent(y: Array) -> tuple[float, float]:
+    """Find minimum and maximum of channel averages block by block."""
+    lower, upper = math.inf, -math.inf
+    for index in pyrc.chunks(y):
+        block = mean_channels(y[index])
+        if len(block):
+            lower, upper = min(lower, block.min()), max(upper, block.max())
+    return lower, upper
+
+
+def minmax(x: Array, y: Array, width: int) -> tuple[Array, Array]:
+    """Downsample line to minimum and maximum points of each pixel column.
+
+    Channel columns of 2 dimensional y are averaged block by block.
+    """
+    numpy = dyport("numpy")
+    length = len(y)
+    if length <= 2 * width:
+        return x, mean_channels(y)
+
+    step = length // width
+    count = step * width
+    lows, highs = numpy.empty(width, dtype=int), numpy.empty(width, dtype=int)
+    rows = max(1, pyrc.CHUNK_SIZE // step)
+    for first in range(0, width, rows):
+        last = min(first + rows, width)
+        block = mean_channels(y[first * step : last * step])
+        columns = block.reshape(last - first, step)
+        lows[first:last], highs[first:last] = (
+            columns.argmin(axis=1),
+            columns.argmax(axis=1),
+        )
+    offsets = numpy.arange(0, count, step)
+    indices = numpy.column_stack(
+        (numpy.minimum(lows, highs) + offsets, numpy.maximum(lows, highs) + offsets)
+    ).ravel()
+    if count < length:
+        tail = mean_channels(y[count:])
+        extra = sorted({count + int(tail.argmin()), count + int(tail.argmax())})
+        indices = numpy.concatenate((indices, extra))
+    return x[indices], mean_channels(y[indices])
+
+
 def mono(array: Array) -> Array:
     """Average 2 dimensional array into 1 dimension."""
-    if array.ndim == 1:
-        return array
-    if array.shape[0] < array.shape[1]:
-        return array.mean(axis=0)
-    return array.mean(axis=1)
+    return mean_channels(channels_last(array))
+
+
+def octave_bins(x: Array, y: Array, fraction: Union[str, float]) -> tuple[Array, Array]:
+    """Average spectrum into fractional octave bands.
+
+    Bands are centered on 1 kHz and band means are computed with cumulative
+    sums. The zero frequency bin and bands without bins are dropped.
+
+    Arguments:
+        x: Increasing frequencies.
+        y: Spectrum values.
+        fraction: Band width in octaves, such as "1/3" or 0.5.
+
+    Returns:
+        Band center frequencies and mean values.
+    """
+    numpy = dyport("numpy")
+    width = float(fractions.Fraction(fraction))
+    if width <= 0:
+        msg = f"Octave fraction must be positive but is {fraction}."
+        raise ValueError(msg)
+
+    start = int(numpy.searchsorted(x, 0, side="right"))
+    x, y = x[start:], y[start:]
+    if len(x) == 0:
+        return x, y
+    lower = numpy.floor(numpy.log2(x[0] / 1_000) / width)
+    upper = numpy.ceil(numpy.log2(x[-1] / 1_000) / width)
+    bands = numpy.arange(lower, upper + 1)
+    centers = 1_000 * 2 ** (bands * width)
+    edges = numpy.searchsorted(
+        x, 1_000 * 2 ** ((numpy.append(bands, upper + 1) - 0.5) * width)
+    )
+
+    sums = numpy.concatenate(([0], numpy.cumsum(y)))
+    counts = numpy.diff(edges)
+    valid = counts > 0
+    means = (sums[edges[1:]] - sums[edges[:-1]])[valid] / counts[valid]
+    return centers[valid], means
 
 
 def palette_cycle() -> itertools.cycle:
@@ -311,6 +658,28 @@ def palette_cycle() -> itertools.cycle:
     )
 
 
+def parallel_map(
+    function: Callable[[Any], Any],
+    items: Sequence[Any],
+    workers: Optional[int] = None,
+) -> list[Any]:
+    """Apply function to items on a thread pool and keep item order.
+
+    NumPy and SciPy transforms release the GIL, so signals are processed
+    concurrently. Single items and single workers run serially.
+
+    Arguments:
+        function: Function to apply.
+        items: Function inputs.
+        workers: Maximum number of threads. Defaults to the CPU count.
+    """
+    workers = min(len(items), workers or os.cpu_count() or 1)
+    if workers <= 1:
+        return [function(item) for item in items]
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(function, items))
+
+
 def phase(
     *signals: Signal,
     axes: Optional[list[Any]] = None,
@@ -318,10 +687,17 @@ def phase(
     overlay: bool = True,
     rate: Optional[int] = None,
     show: bool = True,
+    smooth: Optional[Union[str, float]] = None,
+    workers: Optional[int] = None,
     x: Optional[Array] = None,
     **kwargs: Any,
 ) -> None:
-    """Plot audio frequency phase."""
+    """Plot audio frequency phase.
+
+    Phases are averaged into fractional octave bands if smooth is a fraction,
+    such as "1/3". Workers limits the threads that transform signals.
+    """
+    pyrc.prefetch(DEPENDENCIES)
     numpy, pyplot = dyport("numpy"), dyport("matplotlib.pyplot")
     overlay = kwargs.pop("o", overlay)
     rate = kwargs.pop("r", rate)
@@ -336,12 +712,18 @@ def phase(
     axes[0].set_ylabel("Phase (rad)")
     ticks = spectrum_ticks()
     x_range, y_range = Range(20, 20_000, True), Range()
-    datas = sigdata(signals, x=x, depth=depth)
+    datas = sigdata(signals, x=x, depth=depth, labels=kwargs.pop("labels", None))
 
-    for index, data in enumerate(datas):
+    def compute(data: dict[str, Any]) -> tuple[Array, Array]:
         rate_ = rate or data.pop("rate", len(data["y"]))
-        y = numpy.unwrap(numpy.angle(numpy.fft.rfft(data["y"])))
-        x_ = data.pop("x", numpy.fft.rfftfreq(len(data["y"]), 1 / rate_))
+        y = numpy.unwrap(numpy.angle(SPECTRA.rfft(data["y"])))
+        x_ = data.pop("x", frequencies(len(data["y"]), rate_))
+        if smooth is not None:
+            x_, y = octave_bins(x_, y, smooth)
+        return x_, y
+
+    results = parallel_map(compute, datas, workers)
+    for index, (data, (x_, y)) in enumerate(zip(datas, results, strict=True)):
         x_range += (x_[0], x_[-1])
         y_range += (y.min(), y.max())
 
@@ -359,6 +741,24 @@ def phase(
         pyplot.show(block=True)
 
 
+def plot_decimated(
+    axis: Any, x: Array, y: Array, method: Optional[str] = None, **kwargs: Any
+) -> Any:
+    """Plot line that is decimated again whenever axis limits change.
+
+    Lines without increasing x values are plotted at full resolution. Channel
+    columns of 2 dimensional y are averaged as the line is decimated.
+    """
+    if method is None or not (x[1:] >= x[:-1]).all():
+        return axis.plot(x, mean_channels(y), **kwargs)[0]
+
+    (line_,) = axis.plot([], [], **kwargs)
+    decimator = Decimator(line_, x, y, method)
+    decimator(axis)
+    axis.callbacks.connect("xlim_changed", decimator)
+    return line_
+
+
 def set_ranges(axes: Iterable[Any], x_range: Range, y_range: Range) -> None:
     """Set ranges for axes if valid."""
     for axis in axes:
@@ -372,26 +772,39 @@ def sigdata(
     signals: Iterable[Signal],
     x: Optional[Array] = None,
     depth: int = 3,
+    labels: Optional[Sequence[str]] = None,
+    downmix: bool = True,
 ) -> list[dict[str, Any]]:
-    """Convert signal into standardized format."""
+    """Convert signal into standardized format.
+
+    Labels default to variable names of signals in the calling scope, which
+    are traced together in a single pass. Multichannel signals are averaged
+    to mono, unless downmix is false, in which case they are oriented with
+    channels along columns for plots that average channels block by block.
+    """
     numpy = dyport("numpy")
+    channels = mono if downmix else channels_last
     palette = palette_cycle()
+    signals = list(signals)
+    if labels is None:
+        defaults = [str(index) for index in range(len(signals))]
+        labels = pyrc.varnames(signals, defaults, depth=depth)
+    elif len(labels) != len(signals):
+        msg = f"Expected {len(signals)} labels but received {len(labels)}."
+        raise ValueError(msg)
 
     datas = []
-    for index, signal in enumerate(signals):
+    for signal, label in zip(signals, labels, strict=True):
         if isinstance(signal, dict):
             signal = cast("dict[str, Any]", signal)
-            y = mono(numpy.asarray(signal.pop("y")))
+            y = channels(numpy.asarray(signal.pop("y")))
             x_ = signal.pop("x", x)
             color = pyrc.popall(signal, ["color", "c"], next(palette))
-            label = pyrc.popall(
-                signal, ["label", "l"], pyrc.varname(signal, str(index), depth=depth)
-            )
             data = {
                 **signal,
                 "y": y,
                 "color": color,
-                "label": label,
+                "label": pyrc.popall(signal, ["label", "l"], label),
             }
             if x_ is not None:
                 data["x"] = mono(numpy.asarray(x_))
@@ -400,19 +813,21 @@ def sigdata(
             x_, y = signal
             data = {
                 "x": mono(numpy.asarray(x_)),
-                "y": mono(numpy.asarray(y)),
+                "y": channels(numpy.asarray(y)),
                 "color": next(palette),
-                "label": pyrc.varname(signal, str(index), depth=depth),
+                "label": label,
             }
         else:
-            y = mono(numpy.asarray(signal))
+            y = channels(numpy.asarray(signal))
             data = {
                 "y": y,
                 "color": next(palette),
-                "label": pyrc.varname(signal, str(index), depth=depth),
+                "label": label,
             }
             if x is not None:
                 data["x"] = mono(numpy.asarray(x))
+            if hasattr(signal, "rate"):
+                data["rate"] = signal.rate
         datas.append(data)
     return datas
 
@@ -423,14 +838,19 @@ def spectrogram(
     depth: int = 3,
     rate: Optional[int] = None,
     show: bool = True,
+    width: Optional[int] = None,
+    workers: Optional[int] = None,
     **kwargs: Any,
 ) -> None:
-    """Plot audio frequency time heatmap with Matplotlib."""
-    numpy, pyplot, signal = (
-        dyport("numpy"),
-        dyport("matplotlib.pyplot"),
-        dyport("scipy.signal"),
-    )
+    """Plot audio frequency time heatmap with Matplotlib.
+
+    Spectrograms are computed in blocks of frames and are max pooled to width
+    time columns if provided. Images are drawn from a pyramid of max pooled
+    levels that matches the visible time range to the axis pixel width.
+    Signals are transformed on a thread pool of up to workers threads.
+    """
+    pyrc.prefetch(DEPENDENCIES)
+    pyplot, signal = dyport("matplotlib.pyplot"), dyport("scipy.signal")
     rate = kwargs.pop("r", rate)
 
     if axes is None:
@@ -444,9 +864,11 @@ def spectrogram(
     axis.set_ylabel("Frequency (Hz)")
     ticks = spectrum_ticks()
     x_range, y_range = Range(), Range(20, 20_000, True)
-    datas = sigdata(signals, depth=depth)
+    datas = sigdata(
+        signals, depth=depth, labels=kwargs.pop("labels", None), downmix=False
+    )
 
-    for data in datas:
+    def compute(data: dict[str, Any]) -> tuple[Array, tuple[float, ...]]:
         rate_ = rate or data.pop("rate", len(data["y"]))
         transform = signal.ShortTimeFFT.from_window(
             ("gaussian", 1e-2 * rate_),
@@ -456,29 +878,34 @@ def spectrogram(
             nperseg=512,
         )
         bounds = transform.extent(len(data["y"]), center_bins=True)
-
-        z_ = transform.stft(data["y"])
-        x = numpy.linspace(bounds[0], bounds[1], num=z_.shape[1])
-        y = numpy.linspace(bounds[2], bounds[3], num=z_.shape[0])
-        z = pyrc.decibel(numpy.abs(z_))
-        x_range += (x.min(), x.max())
-        y_range += (y.min(), y.max())
-
-        mesh = axis.pcolormesh(
-            x,
-            y,
-            z,
-            antialiased=True,
+        z = stft_decibels(transform, data["y"], width=width)
+        # Zero frequency row is dropped since it has no place on a log axis.
+        height = (bounds[3] - bounds[2]) / z.shape[0]
+        return z, (bounds[0], bounds[1], bounds[2] + height, bounds[3])
+
+    for z, extent in parallel_map(compute, datas, workers):
+        x_range += extent[:2]
+        y_range += extent[2:]
+
+        image = axis.imshow(
+            z[1:],
+            aspect="auto",
             cmap="viridis",
-            shading="auto",
+            extent=extent,
+            origin="lower",
+            vmax=z.max(),
+            vmin=z.min(),
         )
+        pyramid = Pyramid(image, z[1:])
+        pyramid(axis)
+        axis.callbacks.connect("xlim_changed", pyramid)
         axis.set_xlabel("Time (s)")
         axis.set_yscale("log")
         axis.set_yticks(ticks[0])
         axis.set_yticklabels(ticks[1])
 
     set_ranges([axis], x_range, y_range)
-    axis.figure.colorbar(mesh, ax=axes, label="Level (dB)")
+    axis.figure.colorbar(image, ax=axes, label="Level (dB)")
     if show:
         pyplot.show(block=True)
 
@@ -492,6 +919,57 @@ def spectrum_ticks() -> tuple[list[float], list[str]]:
     return ticks.tolist(), labels
 
 
+def stft_block(transform: Any, signal: Array, first: int, last: int) -> Array:
+    """Compute short time Fourier transform of frames with averaged channels.
+
+    Only the samples of the frames are averaged, and they start on a hop
+    boundary so that frame positions shift by a whole number of frames.
+    """
+    if signal.ndim == 1:
+        return transform.stft(signal, p0=first, p1=last)
+    hop = transform.hop
+    lower = max((first * hop - transform.m_num_mid) // hop, 0)
+    upper = (last - 1) * hop - transform.m_num_mid + transform.m_num
+    samples = mean_channels(signal[lower * hop : max(upper, 0)])
+    return transform.stft(samples, p0=first - lower, p1=last - lower)
+
+
+def stft_decibels(transform: Any, signal: Array, width: Optional[int] = None) -> Array:
+    """Compute short time Fourier transform magnitudes in decibels by blocks.
+
+    Blocks of frames are transformed and converted in place into a float32
+    output, so peak memory depends on block size instead of signal length.
+
+    Arguments:
+        transform: SciPy ShortTimeFFT instance.
+        signal: One dimensional signal or array with channels along columns,
+            which may be memory mapped. Channels are averaged block by block.
+        width: Number of time columns to max pool frames into.
+
+    Returns:
+        Decibel magnitudes with frequencies along rows and time along columns.
+    """
+    numpy = dyport("numpy")
+    start, stop = transform.p_min, transform.p_max(len(signal))
+    frames = stop - start
+    columns = frames if width is None else min(width, frames)
+    out = numpy.full((transform.f_pts, columns), -numpy.inf, dtype=numpy.float32)
+    block = max(1, pyrc.CHUNK_SIZE // transform.f_pts)
+    buffer = numpy.empty((transform.f_pts, block), dtype=numpy.float32)
+
+    for first in range(start, stop, block):
+        last = min(first + block, stop)
+        decibels = buffer[:, : last - first]
+        numpy.abs(stft_block(transform, signal, first, last), out=decibels)
+        pyrc.decibel(decibels, out=decibels)
+        if columns == frames:
+            out[:, first - start : last - start] = decibels
+        else:
+            indices = (numpy.arange(first, last) - start) * columns // frames
+            numpy.maximum.at(out, (slice(None), indices), decibels)
+    return out
+
+
 def subplots(*args: Any, title: Optional[str] = None, **kwargs: Any) -> tuple[Any, Any]:
     """Wrapper for Matplotlib subplots."""
     pyplot = dyport("matplotlib.pyplot")
@@ -506,6 +984,7 @@ def subplots(*args: Any, title: Optional[str] = None, **kwargs: Any) -> tuple[An
 def waveform(
     *signals: Signal,
     axes: Optional[list[Any]] = None,
+    decimate: Optional[str] = "minmax",
     depth: int = 3,
     overlay: bool = True,
     rate: Optional[int] = None,
@@ -514,7 +993,13 @@ def waveform(
     x: Optional[Array] = None,
     **kwargs: Any,
 ) -> None:
-    """Plot audio waveform."""
+    """Plot audio waveform.
+
+    Waveforms are decimated to the axis pixel width with the "minmax" or
+    "lttb" method, unless decimate is None. Channels of linear scale
+    waveforms are averaged block by block as they are decimated.
+    """
+    pyrc.prefetch(DEPENDENCIES)
     numpy, pyplot = dyport("numpy"), dyport("matplotlib.pyplot")
     overlay = kwargs.pop("o", overlay)
     rate = kwargs.pop("r", rate)
@@ -529,17 +1014,23 @@ def waveform(
         axes = axes[0]
     axes[0].set_ylabel(f"Amplitude{scale.unit()}")
     x_range, y_range = Range(), Range(-1, 1, True)
-    datas = sigdata(signals, x=x, depth=depth)
+    datas = sigdata(
+        signals,
+        x=x,
+        depth=depth,
+        labels=kwargs.pop("labels", None),
+        downmix=scale != Scale.Linear,
+    )
 
     for index, data in enumerate(datas):
         rate_ = rate or data.pop("rate", len(data["y"]))
         x_ = data.pop("x", numpy.linspace(0, len(data["y"]) / rate_, len(data["y"])))
         y = scale(data["y"])
         x_range += (x_[0], x_[-1])
-        y_range += (y.min(), y.max())
+        y_range += mean_extent(y)
 
         axis = axes[0 if overlay else index]
-        axis.plot(x_, y, color=data["color"], label=data["label"])
+        plot_decimated(axis, x_, y, decimate, color=data["color"], label=data["label"])
         axis.set_xlabel("Time (s)")
         axis.set_yscale(scale.axis())
         axis.legend(loc="upper right")
@@ -547,3 +1038,50 @@ def waveform(
     set_ranges(axes, x_range, y_range)
     if show:
         pyplot.show(block=True)
+
+
+def welch(
+    signal: Array,
+    rate: float,
+    segment: int = 4096,
+    overlap: Optional[int] = None,
+    window: str = "hann",
+) -> tuple[Array, Array]:
+    """Compute amplitude spectrum with Welch's method one batch at a time.
+
+    Arguments:
+        signal: One dimensional signal or array with channels along columns,
+            which may be memory mapped. Channels are averaged batch by batch.
+        rate: Signal sample rate.
+        segment: Number of samples per segment.
+        overlap: Number of samples shared by adjacent segments. Defaults to
+            half of the segment.
+        window: SciPy window name.
+
+    Returns:
+        Frequencies and root mean square segment magnitudes, which are scaled
+        so that sinusoid peaks match their amplitudes.
+    """
+    numpy, scipy_signal = dyport("numpy"), dyport("scipy.signal")
+    segment = min(segment, len(signal))
+    overlap = segment // 2 if overlap is None else overlap
+    step = segment - overlap
+    if not 0 < step <= segment:
+        msg = f"Overlap {overlap} must be smaller than segment {segment}."
+        raise ValueError(msg)
+
+    taper = scipy_signal.get_window(window, segment)
+    power = numpy.zeros(segment // 2 + 1)
+    count = (len(signal) - segment) // step + 1
+    batch = max(1, pyrc.CHUNK_SIZE // segment)
+    for first in range(0, count, batch):
+        last = min(first + batch, count)
+        block = mean_channels(
+            numpy.asarray(signal[first * step : (last - 1) * step + segment])
+        )
+        views = numpy.lib.stride_tricks.sliding_window_view(block, segment)[::step]
+        spectra = numpy.fft.rfft(views * taper, axis=-1)
+        power += (spectra.real**2 + spectra.imag**2).sum(axis=0)
+
+    amplitude = numpy.sqrt(power / count) * 2 / taper.sum()
+    return frequencies(segment, rate), amplitude
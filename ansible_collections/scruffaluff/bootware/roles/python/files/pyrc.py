@@ -1,7 +1,7 @@
 """Python debugger settings file."""
 
 # Explicit optional, union, and quoted types are used to support older Python versions.
-# ruff: noqa: ANN401, D102, UP007, UP037, UP045
+# ruff: noqa: ANN401, D102, D415, UP007, UP037, UP045
 
 from __future__ import annotations
 
@@ -10,20 +10,29 @@ import builtins
 import contextlib
 import functools
 import importlib
+import importlib.util
 import inspect
 import itertools
+import json
 import os
 import pprint
 import re
+import reprlib
 import shlex
+import string
+import struct
 import subprocess
 import sys
-import tempfile
+import threading
+import types
 from argparse import ArgumentError, ArgumentParser
 from ast import Load, Name
+from collections import deque
 from collections.abc import Callable
+from importlib.machinery import ModuleSpec, PathFinder
 from pathlib import Path
 from typing import (
+    IO,
     TYPE_CHECKING,
     Any,
     NamedTuple,
@@ -37,7 +46,43 @@ from typing import (
 if TYPE_CHECKING:
     from argparse import Namespace
     from collections.abc import Callable, Iterable, Iterator, Sequence
-    from types import ModuleType
+    from types import CodeType, ModuleType
+
+IDENT_START = frozenset(f"_{string.ascii_letters}")
+IDENT_CHARS = IDENT_START | frozenset(string.digits)
+
+# Debugger commands by name, which PDB and LLDB settings bind at startup.
+COMMANDS: dict[str, Command] = {}
+
+# Dynamic imports wait for in flight imports, such as from warmup threads.
+DYPORT_LOCK = threading.RLock()
+
+# Number of elements processed at a time by chunked signal transforms.
+CHUNK_SIZE = 2**18
+
+# NumPy types of WAV sample formats and bit depths.
+WAVE_DTYPES = {
+    (1, 8): "|u1",
+    (1, 16): "<i2",
+    (1, 32): "<i4",
+    (3, 32): "<f4",
+    (3, 64): "<f8",
+}
+WAVE_FORMAT_EXTENSIBLE = 0xFFFE
+
+# Size method types whose results footprint trusts.
+SIZEOF_ROUTINES = (
+    types.BuiltinFunctionType,
+    types.FunctionType,
+    types.MethodDescriptorType,
+    types.WrapperDescriptorType,
+)
+
+# Arrays larger than this many bytes are played back in blocks.
+PLAYBACK_CHUNK_BYTES = 64 * 2**20
+
+# Active block playback, which is kept alive until the next playback starts.
+PLAYER: Optional[Player] = None
 
 
 class Array(Protocol):
@@ -52,6 +97,134 @@ class Array(Protocol):
     def ndim(self) -> int: ...
     @property
     def shape(self) -> Sequence[int]: ...
+    @property
+    def size(self) -> int: ...
+
+
+class BoundedRepr(reprlib.Repr):
+    """Representation bounded in size at every nesting level.
+
+    Container and text limits shrink tenfold with each nesting level and large
+    arrays are summarized wherever they occur.
+    """
+
+    def __init__(self, limit: int) -> None:
+        """Create a new BoundedRepr instance."""
+        super().__init__()
+        self.limit = limit
+        self.maxlevel = 3
+        self.truncated = False
+
+    def repr1(self, x: Any, level: int) -> str:
+        """Format value with limits for its nesting level."""
+        depth = self.maxlevel - level
+        width = max(self.limit // 10**depth, 1)
+        text = self.limit * 100 if depth == 0 else width * 10
+        if all(hasattr(x, attr) for attr in ("dtype", "shape", "size")):
+            if x.size > width:
+                self.truncated = True
+                return summarize_array(x)
+        elif isinstance(x, (deque, dict, frozenset, list, set, tuple)) and (
+            len(x) > width or (level <= 0 and len(x) > 0)
+        ):
+            self.truncated = True
+
+        self.maxarray = self.maxdeque = self.maxdict = self.maxfrozenset = width
+        self.maxlist = self.maxset = self.maxtuple = width
+        self.maxlong = self.maxother = self.maxstring = text
+        repr_ = super().repr1(x, level)
+        if len(repr_) >= text:
+            self.truncated = True
+        return repr_
+
+
+class Command(NamedTuple):
+    """Debugger command declaration shared by PDB and LLDB."""
+
+    name: str
+    aliases: tuple[str, ...]
+    handler: Callable[..., Any]
+    parser: Optional[Parser]
+    complete: bool
+    debuggers: frozenset[str]
+    interpolate: bool
+
+    def run(self, debugger: Any, line: str, lookup: Callable[[str], Any]) -> Any:
+        """Parse command line and execute command handler.
+
+        Arguments:
+            debugger: Native debugger instance passed to the handler.
+            line: Command line after the command name.
+            lookup: Debugger frame variable lookup for interpolation.
+
+        Returns:
+            The handler result.
+        """
+        if self.interpolate:
+            line = parse_exprs(lookup, line)
+        if self.parser is None:
+            return self.handler(debugger, line, None)
+        rest, args = self.parser.parse_line(line)
+        return self.handler(debugger, rest, args)
+
+
+class DocEntry(NamedTuple):
+    """Searchable documentation for a named object."""
+
+    name: str
+    signature: str
+    doc: str
+
+
+class DyportFinder:
+    """Module finder for packages in the dynamic import install directory.
+
+    Only top level modules from a precomputed index are served, so unrelated
+    imports skip the install directory and lookups do not scan it.
+    """
+
+    def __init__(self, path: str) -> None:
+        """Create a new DyportFinder instance."""
+        self.path = path
+        self.index: dict[str, str] = {}
+        self.invalidate_caches()
+
+    def find_distributions(self, context: Any = None) -> Iterator[Any]:
+        """Find package metadata in the install directory."""
+        from importlib.metadata import (  # noqa: PLC0415
+            DistributionFinder,
+            MetadataPathFinder,
+        )
+
+        name = getattr(context, "name", None)
+        context_ = DistributionFinder.Context(name=name, path=[self.path])
+        return MetadataPathFinder.find_distributions(context_)
+
+    def find_spec(
+        self,
+        fullname: str,
+        path: Any = None,
+        target: Any = None,  # noqa: ARG002
+    ) -> Optional[ModuleSpec]:
+        """Find spec for top level modules in the install directory."""
+        if path is not None or fullname not in self.index:
+            return None
+        return PathFinder.find_spec(fullname, [self.path])
+
+    def invalidate_caches(self) -> None:
+        """Rebuild index of top level modules in the install directory."""
+        index = {}
+        with contextlib.suppress(FileNotFoundError):
+            for entry in os.scandir(self.path):
+                name_ = entry.name.split(".", maxsplit=1)[0]
+                if entry.is_dir():
+                    if "." not in entry.name and name_ != "__pycache__":
+                        index[name_] = entry.path
+                elif name_.isidentifier() and entry.name.endswith(
+                    (".py", ".pyd", ".so")
+                ):
+                    index[name_] = entry.path
+        self.index = index
 
 
 class Expr(NamedTuple):
@@ -95,38 +268,392 @@ class Parser(ArgumentParser):
         return rest, args
 
 
-def aplay(
+class Player:
+    """Streaming audio player that reads blocks directly from its source.
+
+    Blocks are sliced from the source array inside the output stream callback,
+    so memory mapped files are paged in and converted only as they play.
+    """
+
+    def __init__(  # noqa: PLR0913, PLR0917
+        self,
+        data: Array,
+        rate: Optional[int] = None,
+        map: Optional[Sequence[int]] = None,  # noqa: A002
+        loop: bool = False,
+        offset: int = 0,
+        blocksize: int = 4096,
+        **kwargs: Any,
+    ) -> None:
+        """Create a new Player instance."""
+        sounddevice = dyport("sounddevice")
+        self.data = data if data.ndim == 2 else data.reshape(-1, 1)
+        length, channels = self.data.shape
+        if offset < 0:
+            offset += length
+        if not 0 <= offset <= length:
+            msg = f"Offset {offset} is outside of data with {length} frames."
+            raise ValueError(msg)
+        if map is not None and len(map) != channels:
+            msg = f"Channel map has {len(map)} entries for {channels} channels."
+            raise ValueError(msg)
+
+        self.finished = threading.Event()
+        self.loop = loop
+        self.mapping = None if map is None else [channel - 1 for channel in map]
+        self.position = offset
+        self.stop_error = sounddevice.CallbackStop
+        self.stream = sounddevice.OutputStream(
+            blocksize=blocksize,
+            callback=self.callback,
+            channels=channels if map is None else max(map),
+            dtype="float32" if self.data.dtype.kind == "f" else self.data.dtype.name,
+            finished_callback=self.finished.set,
+            samplerate=rate,
+            **kwargs,
+        )
+
+    def callback(self, outdata: Any, frames: int, _time: Any, _status: Any) -> None:
+        """Copy next block of source data into the output buffer."""
+        if self.mapping is not None:
+            outdata.fill(0)
+        length = len(self.data)
+        written = 0
+        while written < frames and self.position < length:
+            chunk = self.data[self.position : self.position + frames - written]
+            if self.mapping is None:
+                outdata[written : written + len(chunk)] = chunk
+            else:
+                outdata[written : written + len(chunk), self.mapping] = chunk
+            written += len(chunk)
+            self.position += len(chunk)
+            if self.loop and self.position == length:
+                self.position = 0
+
+        if written < frames:
+            outdata[written:] = 0
+            raise self.stop_error
+
+    def close(self) -> None:
+        """Stop playback and release output stream."""
+        self.stream.close()
+        self.finished.set()
+
+    def start(self) -> Player:
+        """Start playback."""
+        self.stream.start()
+        return self
+
+    def wait(self) -> None:
+        """Wait until playback finishes."""
+        self.finished.wait()
+
+
+class Recorder:
+    """Streaming audio recorder backed by a fixed size ring buffer.
+
+    An input stream callback writes into a preallocated buffer, so memory use
+    stays bounded no matter how long the recorder runs.
+    """
+
+    def __init__(  # noqa: PLR0913, PLR0917
+        self,
+        rate: Optional[int] = None,
+        channels: int = 1,
+        dtype: str = "float32",
+        seconds: float = 10.0,
+        blocksize: int = 1024,
+        map: Optional[Sequence[int]] = None,  # noqa: A002
+        **kwargs: Any,
+    ) -> None:
+        """Create a new Recorder instance."""
+        numpy, sounddevice = dyport_many("numpy", "sounddevice")
+        if rate is None:
+            device = sounddevice.query_devices(kind="input")
+            rate = int(device["default_samplerate"])
+        self.active = False
+        self.blocksize = blocksize
+        self.condition = threading.Condition()
+        self.dropped = 0
+        self.frames = 0
+        self.mapping = None if map is None else [channel - 1 for channel in map]
+        self.overflows = 0
+        self.rate = rate
+
+        capacity = max(round(seconds * rate), blocksize)
+        columns = channels if map is None else len(map)
+        self.buffer = numpy.zeros((capacity, columns), dtype=dtype)
+        self.stream = sounddevice.InputStream(
+            blocksize=blocksize,
+            callback=self.callback,
+            channels=channels if map is None else max(map),
+            dtype=dtype,
+            samplerate=rate,
+            **kwargs,
+        )
+
+    def __enter__(self) -> Recorder:  # noqa: PYI034
+        """Start recording on context entry."""
+        return self.start()
+
+    def __exit__(self, *_args: object) -> None:
+        """Close input stream on context exit."""
+        self.close()
+
+    def blocks(
+        self, size: Optional[int] = None, timeout: Optional[float] = None
+    ) -> Iterator[Array]:
+        """Generate consecutive fixed size blocks of recorded audio.
+
+        Iteration starts at the oldest frame in the ring buffer and ends after
+        the recorder stops and remaining frames are read. Frames overwritten
+        before being read are skipped and added to dropped.
+
+        Arguments:
+            size: Number of frames per block. Defaults to stream block size.
+            timeout: Seconds to wait for each block before stopping.
+        """
+        size = size or self.blocksize
+        capacity = len(self.buffer)
+        if size > capacity:
+            msg = f"Block size {size} exceeds ring buffer capacity {capacity}."
+            raise ValueError(msg)
+
+        with self.condition:
+            position = max(0, self.frames - capacity)
+        while True:
+            with self.condition:
+                while self.frames - position < size:
+                    if not self.active or not self.condition.wait(timeout):
+                        return
+                if self.frames - position > capacity:
+                    self.dropped += self.frames - capacity - position
+                    position = self.frames - capacity
+                block = self.read(position, size)
+            position += size
+            yield block
+
+    def callback(self, indata: Array, frames: int, _time: Any, status: Any) -> None:
+        """Copy input stream data into the ring buffer."""
+        if status:
+            self.overflows += 1
+        data = indata if self.mapping is None else indata[:, self.mapping]
+        capacity = len(self.buffer)
+        data = data[-capacity:]
+        with self.condition:
+            start = (self.frames + frames - len(data)) % capacity
+            split = min(capacity - start, len(data))
+            self.buffer[start : start + split] = data[:split]
+            self.buffer[: len(data) - split] = data[split:]
+            self.frames += frames
+            self.condition.notify_all()
+
+    def close(self) -> None:
+        """Stop recording and release input stream."""
+        self.stop()
+        self.stream.close()
+
+    def read(self, start: int, count: int) -> Array:
+        """Copy frames from the ring buffer in chronological order."""
+        numpy = dyport("numpy")
+        index = start % len(self.buffer)
+        stop = index + count
+        if stop <= len(self.buffer):
+            return self.buffer[index:stop].copy()
+        return numpy.concatenate(
+            (self.buffer[index:], self.buffer[: stop - len(self.buffer)])
+        )
+
+    def snapshot(self, seconds: Optional[float] = None) -> Array:
+        """Copy the most recently recorded audio.
+
+        Arguments:
+            seconds: Duration of audio to copy. Defaults to the entire buffer.
+        """
+        with self.condition:
+            count = min(self.frames, len(self.buffer))
+            if seconds is not None:
+                count = min(count, round(seconds * self.rate))
+            return self.read(self.frames - count, count)
+
+    def start(self) -> Recorder:
+        """Start recording if not already active."""
+        if not self.active:
+            self.active = True
+            self.stream.start()
+        return self
+
+    def stop(self) -> None:
+        """Stop recording and wake waiting block readers."""
+        if self.active:
+            self.stream.stop()
+        with self.condition:
+            self.active = False
+            self.condition.notify_all()
+
+
+def aplay(  # noqa: PLR0913, PLR0917
     data: Array,
     rate: Optional[int] = None,
     map: Optional[Sequence[int]] = None,  # noqa: A002
     block: bool = False,
     loop: bool = False,
+    offset: int = 0,
+    chunked: Optional[bool] = None,
     **kwargs: Any,
-) -> None:
+) -> Optional[Player]:
     """Play back a NumPy array containing audio data.
 
     Arguments:
-        data: Audio data to be played back. The columns of a two-dimensional
-            array are interpreted as channels, one-dimensional arrays are
-            treated as mono data.
-        rate: Audio sample rate.
+        data: Audio data to be played back, such as an array or sequence. The
+            columns of a two-dimensional array are interpreted as channels,
+            one-dimensional arrays are treated as mono data.
+        rate: Audio sample rate. Defaults to the rate attribute of data.
         map: List of channel numbers, starting with 1, where the columns of
             data shall be played back.
         block: Whether to wait until playback finishes.
         loop: Play data in a loop.
-        kwargs: Additional arguments for sounddevice play.
+        offset: Frame to start playback from. Negative values count from the
+            end of data.
+        chunked: Whether to stream data in blocks instead of loading it up
+            front. Defaults to true for memory maps, large arrays, and nonzero
+            offsets, which require chunked playback.
+        kwargs: Additional arguments for sounddevice play or OutputStream.
+
+    Returns:
+        The player for chunked playback.
     """
-    sounddevice = dyport("sounddevice")
-    sounddevice.play(
-        data,
-        samplerate=rate,
-        mapping=map,
-        blocking=block,
-        loop=loop,
-        **kwargs,
+    global PLAYER  # noqa: PLW0603
+    numpy, sounddevice = dyport_many("numpy", "sounddevice")
+    rate = rate or getattr(data, "rate", None)
+    # Memory maps are kept as is so that playback does not load them.
+    if not isinstance(data, numpy.memmap):
+        data = numpy.asarray(data)
+    if chunked is False and offset != 0:
+        msg = f"Offset {offset} requires chunked playback."
+        raise ValueError(msg)
+    if PLAYER is not None:
+        PLAYER.close()
+        PLAYER = None
+    if chunked is None:
+        chunked = (
+            offset != 0
+            or isinstance(data, numpy.memmap)
+            or data.size * data.dtype.itemsize > PLAYBACK_CHUNK_BYTES
+        )
+
+    if not chunked:
+        sounddevice.play(
+            data,
+            samplerate=rate,
+            mapping=map,
+            blocking=block,
+            loop=loop,
+            **kwargs,
+        )
+        return None
+
+    sounddevice.stop()
+    PLAYER = Player(data, rate=rate, map=map, loop=loop, offset=offset, **kwargs)
+    PLAYER.start()
+    if block:
+        PLAYER.wait()
+    return PLAYER
+
+
+def apropos(query: str, modules: Optional[Iterable[str]] = None) -> None:
+    """Search documentation of modules and print matches with default pager.
+
+    Arguments:
+        query: Whitespace separated terms that must all appear in an object's
+            name, signature, or docstring.
+        modules: Module names to search. Defaults to loaded modules and
+            packages installed by dyport.
+    """
+    terms = query.lower().split()
+    if not terms:
+        msg = "Apropos query must contain at least one term"
+        raise ValueError(msg)
+
+    matches = []
+    for entry in index_docs(modules):
+        text = f"{entry.name} {entry.signature} {entry.doc}".lower()
+        if all(term in text for term in terms):
+            # Objects with matching names are ranked ahead of docstring matches.
+            named = all(term in entry.name.lower() for term in terms)
+            matches.append((not named, entry.name, entry))
+    if not matches:
+        msg = f"Unable to find documentation matching '{query}'"
+        raise LookupError(msg)
+
+    matches.sort()
+    page(
+        f"{entry.name}{entry.signature}\n    {entry.doc.partition(chr(10))[0]}\n"
+        for _, _, entry in matches
     )
 
 
+def aread(path: Union[str, Path], mode: str = "r") -> Array:
+    """Memory map PCM or floating point WAV file audio data.
+
+    Arguments:
+        path: WAV file path.
+        mode: Memory map mode, such as "r" for read only or "r+" for writes.
+
+    Returns:
+        Memory mapped audio data with the sample rate as a rate attribute.
+        Multichannel files have one column per channel.
+    """
+    numpy = dyport("numpy")
+    with Path(path).open("rb") as file:
+        header = file.read(12)
+        if len(header) < 12 or header[:4] != b"RIFF" or header[8:] != b"WAVE":
+            msg = f"File '{path}' is not a WAV file."
+            raise ValueError(msg)
+
+        format_ = None
+        while len(header := file.read(8)) == 8:
+            id_, size = struct.unpack("<4sI", header)
+            if id_ == b"fmt ":
+                chunk = file.read(size)
+                if len(chunk) < 16:
+                    msg = f"WAV file '{path}' has an invalid format chunk."
+                    raise ValueError(msg)
+                tag, channels, rate = struct.unpack("<HHI", chunk[:8])
+                bits = struct.unpack("<H", chunk[14:16])[0]
+                if tag == WAVE_FORMAT_EXTENSIBLE and len(chunk) >= 26:
+                    tag = struct.unpack("<H", chunk[24:26])[0]
+                format_ = (tag, channels, rate, bits)
+            elif id_ == b"data":
+                offset = file.tell()
+                break
+            else:
+                file.seek(size + size % 2, os.SEEK_CUR)
+        else:
+            msg = f"WAV file '{path}' has no data chunk."
+            raise ValueError(msg)
+        length = os.fstat(file.fileno()).st_size - offset
+
+    if format_ is None:
+        msg = f"WAV file '{path}' has no format chunk."
+        raise ValueError(msg)
+    tag, channels, rate, bits = format_
+    dtype = WAVE_DTYPES.get((tag, bits))
+    if dtype is None or channels == 0:
+        msg = (
+            f"Unsupported WAV format {tag} with {channels} channels of {bits} bit "
+            "samples."
+        )
+        raise ValueError(msg)
+
+    # Truncated recordings and streaming placeholder sizes exceed the file.
+    frames = min(size, length) // (channels * bits // 8)
+    shape = (frames,) if channels == 1 else (frames, channels)
+    data = numpy.memmap(path, dtype=dtype, mode=mode, offset=offset, shape=shape)
+    data.rate = rate
+    return data
+
+
 def arec(  # noqa: PLR0913, PLR0917
     frames: Optional[int] = None,
     rate: Optional[int] = None,
@@ -167,45 +694,237 @@ def arec(  # noqa: PLR0913, PLR0917
     )
 
 
+def astream(  # noqa: PLR0913, PLR0917
+    rate: Optional[int] = None,
+    channels: int = 1,
+    dtype: str = "float32",
+    seconds: float = 10.0,
+    blocksize: int = 1024,
+    map: Optional[Sequence[int]] = None,  # noqa: A002
+    **kwargs: Any,
+) -> Recorder:
+    """Record audio continuously into a ring buffer.
+
+    Arguments:
+        rate: Audio sample rate. Defaults to the input device sample rate.
+        channels: Number of channels to record.
+        dtype: Data type of the recording.
+        seconds: Duration of audio kept in the ring buffer.
+        blocksize: Number of frames per stream callback.
+        map: List of channel numbers, starting with 1, where the columns of
+            data shall be recorded.
+        kwargs: Additional arguments for sounddevice InputStream.
+
+    Returns:
+        The started recorder.
+    """
+    recorder = Recorder(
+        rate=rate,
+        channels=channels,
+        dtype=dtype,
+        seconds=seconds,
+        blocksize=blocksize,
+        map=map,
+        **kwargs,
+    )
+    return recorder.start()
+
+
+def awrite(
+    path: Union[str, Path],
+    data: Union[Array, Iterable[Array]],
+    rate: Optional[int] = None,
+    blocksize: int = 2**16,
+) -> None:
+    """Write audio data to a WAV file incrementally.
+
+    Arguments:
+        path: WAV file path.
+        data: Audio array or iterable of audio blocks, such as from a
+            recorder. Columns are interpreted as channels.
+        rate: Audio sample rate. Defaults to the rate attribute of data.
+        blocksize: Number of frames converted and written at a time for
+            arrays.
+
+    Data types are checked on the first block before any samples are written
+    and partial files are removed on errors.
+    """
+    numpy = dyport("numpy")
+    rate = rate or getattr(data, "rate", None)
+    if rate is None:
+        msg = "Sample rate is required for data without a rate attribute."
+        raise ValueError(msg)
+    if hasattr(data, "ndim"):
+        array = cast("Any", data)
+        data = (
+            array[index : index + blocksize]
+            for index in range(0, len(array), blocksize)
+        )
+
+    path = Path(path)
+    channels, dtype, size = 1, numpy.dtype("<f4"), 0
+    try:
+        with path.open("wb") as file:
+            for index, block in enumerate(data):
+                block_ = numpy.asarray(block)
+                if index == 0:
+                    dtype = block_.dtype.newbyteorder("<")
+                    channels = 1 if block_.ndim == 1 else block_.shape[1]
+                    file.write(wave_header(dtype, channels, rate, 0))
+                bytes_ = numpy.ascontiguousarray(block_, dtype=dtype).tobytes()
+                file.write(bytes_)
+                size += len(bytes_)
+            file.seek(0)
+            file.write(wave_header(dtype, channels, rate, size))
+    except BaseException:
+        # Remove partial file so that it is not mistaken for a valid recording.
+        path.unlink(missing_ok=True)
+        raise
+
+
+def bounded_repr(value: Any, limit: int = 100) -> str:
+    """Format value with representation bounded in size.
+
+    Large arrays are summarized by shape, data type, and range. Large containers
+    and strings are truncated at every nesting level. Values that are small all
+    the way down are pretty printed.
+    """
+    repr_ = BoundedRepr(limit)
+    bounded = repr_.repr(value)
+    return bounded if repr_.truncated else pprint.pformat(value)
+
+
 def cat(object_: Any, regex: str | None = None) -> None:
     """Print object catalog with default pager."""
     regex = ".*" if regex is None else regex
-    page(catalog(object_, regex=regex))
+    page(f"{entry}\n" for entry in catalog(object_, regex=regex))
 
 
 def catalog(
     object_: Any,
     regex: str = ".*",
-) -> str:
-    """Convert object to string representation with all attributes."""
+) -> Iterator[str]:
+    """Generate string representations for each object attribute."""
     if hasattr(object_, "__dict__") and object_.__dict__:
         name_ = name(object_)
         regex_ = re.compile(regex, re.IGNORECASE)
 
-        values = []
         for key in sorted(object_.__dict__.keys()):
             # Avoid key __builtins__ since formatting it can cause a crash.
             if not isinstance(key, str) or (
                 key != "__builtins__" and regex_.search(key)
             ):
-                value = pprint.pformat(object_.__dict__[key])
-                values.append(f"{name_}.{key} = {value}")
-        return "\n".join(values)
-    if isinstance(object_, dict):
-        return pprint.pformat({key: object_[key] for key in sorted(object_.keys())})
-    return pprint.pformat(object_)
+                value = bounded_repr(object_.__dict__[key])
+                yield f"{name_}.{key} = {value}"
+    elif isinstance(object_, dict):
+        yield "{"
+        for key in sorted(object_.keys()):
+            yield f"    {key!r}: {bounded_repr(object_[key])},"
+        yield "}"
+    else:
+        yield bounded_repr(object_)
+
+
+def chunks(array: Array, size: int = CHUNK_SIZE) -> Iterator[Any]:
+    """Generate slices along the first axis of roughly size elements each.
+
+    Zero dimensional arrays produce a single ellipsis index.
+    """
+    if array.ndim == 0:
+        yield ...
+        return
+    length = array.shape[0]
+    step = max(1, size * length // max(array.size, 1))
+    for start in range(0, length, step):
+        yield slice(start, start + step)
+
+
+def command(
+    name: str,
+    *aliases: str,
+    arguments: Iterable[tuple[Sequence[str], dict[str, Any]]] = (),
+    complete: bool = False,
+    debuggers: Iterable[str] = ("lldb", "pdb"),
+    interpolate: bool = False,
+) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """Register function as a debugger command.
+
+    Command handlers receive the native debugger, the remaining command line,
+    and the parsed arguments or None if the command has no arguments.
+
+    Arguments:
+        name: Command name.
+        aliases: Alternative command names.
+        arguments: Pairs of flags and options for the command argument parser,
+            which is built once during registration.
+        complete: Whether to complete command lines as Python expressions.
+        debuggers: Debuggers that support the command.
+        interpolate: Whether to substitute % expressions in command lines.
+    """
+
+    def register(handler: Callable[..., Any]) -> Callable[..., Any]:
+        parser = None
+        for flags, options in arguments:
+            parser = parser or Parser()
+            parser.add_argument(*flags, **options)
+        COMMANDS[name] = Command(
+            name=name,
+            aliases=aliases,
+            handler=handler,
+            parser=parser,
+            complete=complete,
+            debuggers=frozenset(debuggers),
+            interpolate=interpolate,
+        )
+        return handler
 
+    return register
 
-def decibel(signal: Array) -> Array:
+
+@functools.lru_cache(maxsize=1024)
+def compile_expr(expression: str) -> tuple[CodeType, tuple[str, ...]]:
+    """Compile Python expression and find the variable names it loads."""
+    tree = ast.parse(expression, mode="eval")
+    names = dict.fromkeys(
+        node.id
+        for node in ast.walk(tree)
+        if isinstance(node, Name) and isinstance(node.ctx, Load)
+    )
+    return compile(tree, "<expr>", "eval"), tuple(names)
+
+
+def decibel(
+    signal: Array, out: Optional[Array] = None, reference: float = 1.0
+) -> Array:
     """Convert signal to decibels.
 
     Avoids passing zeros to log10 by replacing them with the datatype epsilon.
+    Work is done in chunks within the output array, so memory maps and large
+    arrays need no full size temporaries.
+
+    Arguments:
+        signal: Signal array.
+        out: Output array, which may be the signal for an in place transform.
+            Defaults to a new real floating point array of the signal type, so
+            complex spectra convert to real decibels.
+        reference: Amplitude of zero decibels.
     """
     numpy = dyport("numpy")
-
-    epsilon = numpy.finfo(signal.dtype).eps
-    amplitude = numpy.maximum(numpy.abs(signal), epsilon)
-    return 20 * numpy.log10(amplitude)
+    signal = numpy.asarray(signal)
+    if out is None:
+        dtype = numpy.result_type(signal.real.dtype, numpy.float32)
+        out = numpy.empty(signal.shape, dtype=dtype)
+
+    epsilon = numpy.finfo(out.dtype).eps
+    for index in chunks(signal):
+        chunk = out[index]
+        # Magnitude is computed in the output precision to avoid integer overflow.
+        numpy.abs(signal[index], out=chunk, dtype=out.real.dtype)
+        numpy.divide(chunk, abs(float(reference)), out=chunk)
+        numpy.maximum(chunk, epsilon, out=chunk)
+        numpy.log10(chunk, out=chunk)
+        numpy.multiply(chunk, 20, out=chunk)
+    return out
 
 
 def doc(object_: Any) -> None:
@@ -246,33 +965,32 @@ def drop_tokens(tokens: list[str], line: str) -> str:
 @functools.cache
 def dyport(name: str) -> ModuleType:
     """Import library and install if necessary."""
+    with DYPORT_LOCK:
+        dyport_target()
+        try:
+            library = importlib.import_module(name)
+        except ModuleNotFoundError:
+            uv_install([name.split(".", maxsplit=1)[0]])
+            library = importlib.import_module(name)
+    return library
+
+
+def dyport_many(*names: str) -> tuple[ModuleType, ...]:
+    """Import libraries and install missing ones in a single transaction."""
+    prefetch(names)
+    return tuple(dyport(name) for name in names)
+
+
+def dyport_target() -> str:
+    """Get dynamic import install directory and add its module finder."""
     version = f"{sys.version_info.major}.{sys.version_info.minor}"
     target = str(Path.home() / f".config/pyrc/venv/python{version}")
-    if target not in sys.path:
-        sys.path.append(target)
-        importlib.invalidate_caches()
-
-    try:
-        library = importlib.import_module(name)
-    except ModuleNotFoundError:
-        package = name.split(".", maxsplit=1)[0]
-        subprocess.run(
-            [
-                "uv",
-                "--no-config",
-                "pip",
-                "install",
-                "--python",
-                version,
-                "--target",
-                target,
-                package,
-            ],
-            check=True,
-        )
-        importlib.invalidate_caches()
-        library = importlib.import_module(name)
-    return library
+    if not any(
+        isinstance(finder, DyportFinder) and finder.path == target
+        for finder in sys.meta_path
+    ):
+        sys.meta_path.append(DyportFinder(target))
+    return target
 
 
 def edit(object_: Any = None, frame: Any = None) -> None:
@@ -312,55 +1030,88 @@ def edit(object_: Any = None, frame: Any = None) -> None:
 def export() -> None:
     """Add functions to global scope."""
     builtins.aplay = aplay
+    builtins.apropos = apropos
+    builtins.aread = aread
     builtins.arec = arec
+    builtins.astream = astream
+    builtins.awrite = awrite
     builtins.cat = cat
     builtins.decibel = decibel
     builtins.doc = doc
     builtins.dyport = dyport
+    builtins.dyport_many = dyport_many
     builtins.edit = edit
     builtins.normalize = normalize
     builtins.nushell = nushell
     builtins.page = page
     builtins.shell = shell
+    builtins.size = size
     builtins.varname = varname
 
 
-def find_exprs(line: str) -> Iterator[Expr]:  # noqa: C901
+@contextlib.contextmanager
+def file_lock(path: Path) -> Iterator[None]:
+    """Hold an exclusive lock on a file across processes."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("a+b") as file:
+        if sys.platform == "win32":
+            import msvcrt  # noqa: PLC0415
+
+            file.seek(0)
+            while True:
+                # Windows locking gives up after several seconds.
+                try:
+                    msvcrt.locking(file.fileno(), msvcrt.LK_LOCK, 1)
+                    break
+                except OSError:
+                    continue
+            try:
+                yield
+            finally:
+                file.seek(0)
+                msvcrt.locking(file.fileno(), msvcrt.LK_UNLCK, 1)
+        else:
+            import fcntl  # noqa: PLC0415
+
+            fcntl.flock(file.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(file.fileno(), fcntl.LOCK_UN)
+
+
+def find_exprs(line: str) -> Iterator[Expr]:
     """Find variables starting with % or expressions surrounded by %{}."""
-    first_chars = ["_", *map(chr, itertools.chain(range(65, 91), range(97, 123)))]
-    chars = first_chars + list(map(chr, range(48, 58)))
     index = 0
     length = len(line)
-    stack: list[int] = []
-    variable: list[int] = []
 
-    while index < length:
-        character = line[index]
-        try:
-            next_ = line[index + 1]
-        except IndexError:
-            next_ = None
-
-        if stack:
-            if character == "}":
-                start = stack.pop()
-                if not stack:
-                    stack = []
-                    yield Expr(line[start:index], start - 2, index + 1)
-            elif character == "{":
-                stack.append(index + 1)
-            index += 1
-        elif variable:
-            index += 1
-            if next_ not in chars:
-                start = variable.pop()
-                yield Expr(line[start:index], start - 1, index)
-        elif character == "%" and next_ == "{":
-            stack.append(index + 2)
-            index += 2
-        elif character == "%" and next_ in first_chars:
-            variable.append(index + 1)
-            index += 1
+    while True:
+        index = line.find("%", index)
+        if index == -1 or index + 1 == length:
+            return
+
+        next_ = line[index + 1]
+        if next_ == "{":
+            depth = 1
+            stop = index + 2
+            while depth and stop < length:
+                character = line[stop]
+                if character == "{":
+                    depth += 1
+                elif character == "}":
+                    depth -= 1
+                stop += 1
+            # Unclosed expressions extend to the end of the line.
+            if depth:
+                return
+            yield Expr(line[index + 2 : stop - 1], index, stop)
+            index = stop
+        elif next_ in IDENT_START:
+            stop = index + 2
+            while stop < length and line[stop] in IDENT_CHARS:
+                stop += 1
+            yield Expr(line[index + 1 : stop], index, stop)
+            index = stop
         else:
             index += 1
 
@@ -377,19 +1128,141 @@ def find_source(type_: type) -> tuple[str, int]:
 
 def find_vars(lookup: Callable[[str], Any], expression: str) -> dict[str, Any]:
     """Extract variables and their values from a Python expression."""
-    tree = ast.parse(expression, mode="eval")
-    seen = set()
     variables = {}
-
-    for node in ast.walk(tree):
-        name = getattr(node, "id", "")
-        if name not in seen and isinstance(node, Name) and isinstance(node.ctx, Load):
-            seen.add(name)
-            with contextlib.suppress(ValueError):
-                variables[name] = lookup(name)
+    for name_ in compile_expr(expression)[1]:
+        with contextlib.suppress(ValueError):
+            variables[name_] = lookup(name_)
     return variables
 
 
+def footprint(object_: Any, seen: Optional[set[int]] = None) -> int:
+    """Compute memory size of object and all objects it references.
+
+    Object graph is walked iteratively, so deep graphs cannot exceed the
+    recursion limit. Modules, types, and routines are not traversed.
+
+    Arguments:
+        object_: Root of object graph.
+        seen: Identities of objects already counted.
+
+    Returns:
+        Size in bytes.
+    """
+    numpy = sys.modules.get("numpy")
+    seen = set() if seen is None else seen
+    stack = [object_]
+    total = 0
+
+    while stack:
+        item = stack.pop()
+        if id(item) in seen or is_type(item):
+            continue
+        seen.add(id(item))
+
+        # Size methods that are not routines, such as on mocks, can create new
+        # attributes on every call.
+        method = inspect.getattr_static(type(item), "__sizeof__", None)
+        try:
+            if isinstance(method, SIZEOF_ROUTINES):
+                size = sys.getsizeof(item, 0)
+            else:
+                size = object.__sizeof__(item)
+        except Exception:  # noqa: BLE001
+            size = 0
+        # Arrays count their buffer unless they are views of a base array.
+        if numpy is not None and isinstance(item, numpy.ndarray) and item.base is None:
+            size = max(size, item.nbytes)
+        # Objects whose attributes fail to load have no referents.
+        with contextlib.suppress(Exception):
+            stack.extend(referents(item))
+        total += size
+    return total
+
+
+def format_size(bytes_: float) -> str:
+    """Format number of bytes with binary unit prefix."""
+    for unit in ("B", "KiB", "MiB", "GiB"):
+        if abs(bytes_) < 1024:
+            return f"{bytes_:.0f} {unit}" if unit == "B" else f"{bytes_:.1f} {unit}"
+        bytes_ /= 1024
+    return f"{bytes_:.1f} TiB"
+
+
+def index_docs(modules: Optional[Iterable[str]] = None) -> list[DocEntry]:
+    """Get documentation entries for modules from a persistent index.
+
+    Index is stored at ~/.config/pyrc/apropos.json, and modules are only
+    reindexed when their file path or modification time changes.
+    """
+    path = Path.home() / ".config/pyrc/apropos.json"
+    try:
+        index = json.loads(path.read_text())
+    except (OSError, ValueError):
+        index = {}
+
+    if modules is None:
+        modules = searchable_modules()
+
+    changed = False
+    entries = []
+    for module in dict.fromkeys(modules):
+        loaded = sys.modules.get(module)
+        if loaded is None:
+            spec = importlib.util.find_spec(module)
+            file = None if spec is None else spec.origin
+        else:
+            file = getattr(loaded, "__file__", None)
+        if not file or not Path(file).is_file():
+            continue
+
+        mtime = Path(file).stat().st_mtime_ns
+        cached = index.get(module)
+        if cached is None or [cached["path"], cached["mtime"]] != [file, mtime]:
+            try:
+                values = index_module(loaded or importlib.import_module(module))
+            except Exception:  # noqa: BLE001, S112
+                continue
+            cached = {"entries": values, "mtime": mtime, "path": file}
+            index[module] = cached
+            changed = True
+        entries.extend(DocEntry(*entry) for entry in cached["entries"])
+
+    if changed:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temp = path.with_suffix(f".{os.getpid()}.tmp")
+        temp.write_text(json.dumps(index))
+        temp.replace(path)
+    return entries
+
+
+def index_module(module: ModuleType) -> list[DocEntry]:
+    """Get documentation entries for public objects defined in a module."""
+
+    def entry(name_: str, object_: Any) -> DocEntry:
+        try:
+            signature = str(inspect.signature(object_))
+        except (TypeError, ValueError):
+            signature = ""
+        return DocEntry(name_, signature, inspect.getdoc(object_) or "")
+
+    entries = [DocEntry(module.__name__, "", inspect.getdoc(module) or "")]
+    for key, value in sorted(vars(module).copy().items()):
+        if (
+            key.startswith("_")
+            or not callable(value)
+            or getattr(value, "__module__", None) != module.__name__
+        ):
+            continue
+
+        entries.append(entry(f"{module.__name__}.{key}", value))
+        if inspect.isclass(value):
+            for attr in sorted(vars(value)):
+                member = getattr(value, attr, None)
+                if not attr.startswith("_") and callable(member):
+                    entries.append(entry(f"{module.__name__}.{key}.{attr}", member))
+    return entries
+
+
 def is_type(value: Any) -> bool:
     """Check if value is a type or variable."""
     return any(
@@ -406,14 +1279,42 @@ def name(object_: Any) -> str:
     return cast("str", getattr(object_, "__name__", object_.__class__.__name__))
 
 
-def normalize(signal: Array) -> Array:
-    """Scale signal to -1 and +1 range."""
-    numpy = dyport("numpy")
+def normalize(signal: Array, out: Optional[Array] = None) -> Array:
+    """Scale signal to -1 and +1 range.
+
+    Complex signals are scaled to the unit circle by their peak magnitude.
 
-    maximum = numpy.abs(signal).max()
+    Arguments:
+        signal: Signal array.
+        out: Output array, which may be the signal for an in place transform.
+            Defaults to a new floating point array of the signal type.
+    """
+    numpy = dyport("numpy")
+    signal = numpy.asarray(signal)
+    maximum = peak(signal)
     if maximum == 0:
-        return signal
-    return signal / maximum
+        if out is None:
+            return signal
+        out[...] = signal
+        return out
+
+    if out is None:
+        dtype = numpy.result_type(signal.dtype, numpy.float32)
+        out = numpy.empty(signal.shape, dtype=dtype)
+    for index in chunks(signal):
+        numpy.divide(signal[index], maximum, out=out[index])
+    return out
+
+
+@command(
+    "nushell", "nu", arguments=[(["-c", "--cwd"], {"default": None})], interpolate=True
+)
+def cmd_nushell(_debugger: Any, line: str, args: Namespace) -> None:
+    """nu(shell) -c, --cwd <path> [expression]
+
+    Execute Nushell expression or start interactive session.
+    """
+    nushell(line, cwd=args.cwd)
 
 
 def nushell(command: str, **kwargs: Any) -> None:
@@ -422,15 +1323,40 @@ def nushell(command: str, **kwargs: Any) -> None:
     subprocess.run(cmd, check=True, **kwargs)
 
 
-def page(text: str) -> None:
-    """Print string with default pager."""
+def page(text: Union[str, Iterable[str]]) -> None:
+    """Print string or stream of string chunks with default pager.
+
+    Chunks are piped to the pager as they are generated, so output starts
+    before all of the text exists. The pager is always reaped before errors
+    propagate and is terminated on keyboard interrupts.
+    """
     pager = os.environ.get("PAGER", "less")
     basename = Path(pager).name
     command = [pager, "--language", "python"] if basename == "bat" else [pager]
-    with tempfile.NamedTemporaryFile("w") as file:
-        file.write(text)
-        file.flush()
-        subprocess.run([*command, file.name], check=True)
+    chunks = [text] if isinstance(text, str) else text
+
+    process = subprocess.Popen(command, stdin=subprocess.PIPE, text=True)
+    stdin = cast("IO[str]", process.stdin)
+    try:
+        # Pager can exit before reading all text, such as when the user quits.
+        with contextlib.suppress(BrokenPipeError):
+            try:
+                for chunk in chunks:
+                    stdin.write(chunk)
+                    stdin.flush()
+            finally:
+                stdin.close()
+    except KeyboardInterrupt:
+        process.terminate()
+        try:
+            process.wait(timeout=1)
+        except subprocess.TimeoutExpired:
+            process.kill()
+        raise
+    finally:
+        code = process.wait()
+    if code != 0:
+        raise subprocess.CalledProcessError(code, command)
 
 
 def parent_shell() -> str:
@@ -444,19 +1370,37 @@ def parent_shell() -> str:
 
 def parse_exprs(lookup: Callable[[str], Any], line: str) -> str:
     """Parse and possibly execute command line expressions."""
-    offset = 0
+    parts = []
+    position = 0
     for expr in find_exprs(line):
+        code = compile_expr(expr.expr)[0]
         variables = find_vars(lookup, expr.expr)
         try:
-            result = str(eval(expr.expr, {}, variables))  # noqa: S307
+            result = str(eval(code, {}, variables))  # noqa: S307
         # Any exception can occur during an eval statement. If the expression
         # cannot be evaluated, then it should be treated as a literal.
         except Exception:  # noqa: BLE001, S112
             continue
-        insert = shlex.quote(result)
-        line = line[: expr.start + offset] + insert + line[expr.stop + offset :]
-        offset += len(insert) - expr.stop + expr.start
-    return line
+        parts += [line[position : expr.start], shlex.quote(result)]
+        position = expr.stop
+    parts.append(line[position:])
+    return "".join(parts)
+
+
+def peak(signal: Array) -> float:
+    """Find maximum absolute value of signal without full size temporary arrays.
+
+    Complex signals use their magnitudes. Magnitudes are computed in floating
+    point, since the most negative integer has no integer absolute value.
+    """
+    numpy = dyport("numpy")
+    maximum = 0.0
+    for index in chunks(signal):
+        chunk = signal[index]
+        if chunk.size:
+            magnitude = numpy.abs(chunk, dtype=numpy.float64).max()
+            maximum = max(maximum, float(magnitude))
+    return maximum
 
 
 def popall(obj: Any, keys: Union[str, Iterable[str]], default: Any) -> Any:
@@ -469,6 +1413,64 @@ def popall(obj: Any, keys: Union[str, Iterable[str]], default: Any) -> Any:
     return default
 
 
+def prefetch(names: Iterable[str]) -> None:
+    """Install missing top level packages of libraries in a single transaction."""
+    packages = sorted({name.split(".", maxsplit=1)[0] for name in names})
+    with DYPORT_LOCK:
+        dyport_target()
+        missing = [
+            package
+            for package in packages
+            if package not in sys.modules and importlib.util.find_spec(package) is None
+        ]
+        if missing:
+            uv_install(missing)
+
+
+def referents(object_: Any) -> list[Any]:
+    """Get objects directly referenced by an object's contents and attributes.
+
+    Arrays are detected by type rather than attributes, since objects such as
+    mocks create attributes on demand.
+    """
+    numpy = sys.modules.get("numpy")
+    items = []
+    if numpy is not None and isinstance(object_, numpy.ndarray):
+        if object_.base is not None:
+            items.append(object_.base)
+        if object_.dtype.hasobject:
+            items.extend(object_.flat)
+    elif isinstance(object_, memoryview):
+        items.append(object_.obj)
+    elif isinstance(object_, dict):
+        items.extend(object_.keys())
+        items.extend(object_.values())
+    elif isinstance(object_, (deque, frozenset, list, set, tuple)):
+        items.extend(object_)
+
+    if hasattr(object_, "__dict__"):
+        items.append(object_.__dict__)
+    for type_ in type(object_).__mro__:
+        slots = type_.__dict__.get("__slots__", ())
+        for slot in [slots] if isinstance(slots, str) else slots:
+            with contextlib.suppress(AttributeError):
+                items.append(getattr(object_, slot))
+    return items
+
+
+def searchable_modules() -> list[str]:
+    """Get names of public loaded modules and packages installed by dyport."""
+    modules = [
+        name_
+        for name_ in list(sys.modules)
+        if not any(part.startswith("_") for part in name_.split("."))
+    ]
+    for finder in sys.meta_path:
+        if isinstance(finder, DyportFinder):
+            modules += sorted(finder.index)
+    return modules
+
+
 def seq_get(seq: Sequence[Any], pos: int, default: Any) -> Any:
     """Safe implementation of get for sequences."""
     try:
@@ -484,18 +1486,201 @@ def shell(command: list[str]) -> None:
     subprocess.run(command, check=True)
 
 
+def size(object_: Any, regex: Optional[str] = None) -> None:
+    """Print memory footprint of object attributes with default pager.
+
+    Attributes are sorted from largest to smallest and are followed by a total
+    where objects shared between attributes are counted once.
+    """
+    regex_ = re.compile(".*" if regex is None else regex, re.IGNORECASE)
+    if hasattr(object_, "__dict__") and object_.__dict__:
+        items, prefix = object_.__dict__, f"{name(object_)}."
+    elif isinstance(object_, dict):
+        items, prefix = object_, ""
+    else:
+        items, prefix = {name(object_): object_}, ""
+
+    values = {
+        f"{prefix}{key}": value
+        for key, value in items.items()
+        if key != "__builtins__" and regex_.search(str(key))
+    }
+    sizes = sorted(
+        ((footprint(value), key) for key, value in values.items()),
+        key=lambda pair: pair[0],
+        reverse=True,
+    )
+    seen: set[int] = set()
+    total = sum(footprint(value, seen) for value in values.values())
+
+    lines = (f"{format_size(bytes_):>10}  {key}\n" for bytes_, key in sizes)
+    page(itertools.chain(lines, [f"{format_size(total):>10}  total\n"]))
+
+
+def summarize_array(array: Array) -> str:
+    """Summarize array by its shape, data type, and range."""
+    summary = f"{name(array)}(shape={tuple(array.shape)}, dtype={array.dtype}"
+    # Range is unavailable for empty and non-numeric arrays.
+    with contextlib.suppress(Exception):
+        summary += f", min={array.min()}, max={array.max()}"
+    return f"{summary})"
+
+
+def uv_install(packages: Sequence[str]) -> None:
+    """Install packages into dynamic import directory with Uv.
+
+    Installs hold a lock on the target directory so that concurrent processes
+    wait for each other and skip packages that became available meanwhile.
+
+    If a lockfile exists at ~/.config/pyrc/venv/pythonX.Y.lock, all of its
+    pinned requirements are installed instead of the packages and must match
+    their hashes. If a wheelhouse directory exists at ~/.config/pyrc/wheels,
+    requirements are installed offline from its wheels, which requires the
+    lockfile so that wheels are verified.
+    """
+    version = f"{sys.version_info.major}.{sys.version_info.minor}"
+    config = Path.home() / ".config/pyrc"
+    lockfile = config / f"venv/python{version}.lock"
+    target = dyport_target()
+    wheelhouse = config / "wheels"
+
+    with file_lock(Path(target) / ".lock"):
+        importlib.invalidate_caches()
+        missing = [
+            package
+            for package in dict.fromkeys(packages)
+            if importlib.util.find_spec(package) is None
+        ]
+        if not missing:
+            return
+
+        command = [
+            "uv",
+            "--no-config",
+            "pip",
+            "install",
+            "--python",
+            version,
+            "--target",
+            target,
+        ]
+        if wheelhouse.is_dir():
+            if not lockfile.is_file():
+                msg = (
+                    f"Wheelhouse '{wheelhouse}' requires lockfile '{lockfile}' "
+                    "with hashes to verify its wheels."
+                )
+                raise FileNotFoundError(msg)
+            command += ["--offline", "--no-index", "--find-links", str(wheelhouse)]
+        if lockfile.is_file():
+            command += ["--require-hashes", "--requirements", str(lockfile)]
+        else:
+            command += missing
+
+        subprocess.run(command, check=True)
+        importlib.invalidate_caches()
+        if lockfile.is_file():
+            unlocked = [
+                package
+                for package in missing
+                if importlib.util.find_spec(package) is None
+            ]
+            if unlocked:
+                msg = (
+                    f"Packages {', '.join(unlocked)} are not installed by "
+                    f"lockfile '{lockfile}'."
+                )
+                raise ModuleNotFoundError(msg, name=unlocked[0])
+
+
 def varname(var: Any, default: str = "", depth: int = 2) -> str:
     """Trace variable name in calling scope."""
-    frame = inspect.currentframe()
-    if frame is None:
-        return default
+    return varnames([var], [default], depth=depth + 1)[0]
+
 
+def varnames(
+    vars_: Sequence[Any], defaults: Sequence[str], depth: int = 2
+) -> list[str]:
+    """Trace names of several variables in calling scope with a single pass.
+
+    Arguments:
+        vars_: Variables to name.
+        defaults: Names for variables that are not found.
+        depth: Number of frames above this function for the calling scope.
+
+    Returns:
+        Names of variables from calling scope locals and then globals.
+    """
+    frame = inspect.currentframe()
     for _ in range(depth):
-        frame = frame.f_back
         if frame is None:
-            return default
-    vars_ = frame.f_locals.items()
-    try:
-        return next(name for name, value in vars_ if value is var)
-    except StopIteration:
-        return default
+            return list(defaults)
+        frame = frame.f_back
+    if frame is None:
+        return list(defaults)
+
+    ids = {id(var) for var in vars_}
+    names: dict[int, str] = {}
+    for scope in (frame.f_locals, frame.f_globals):
+        for name_, value in scope.items():
+            if len(names) == len(ids):
+                break
+            if id(value) in ids:
+                names.setdefault(id(value), name_)
+    return [
+        names.get(id(var), default)
+        for var, default in zip(vars_, defaults, strict=True)
+    ]
+
+
+def warmup(names: Optional[Iterable[str]] = None) -> Optional[threading.Thread]:
+    """Import libraries with dyport on a background daemon thread.
+
+    Arguments:
+        names: Libraries to import. Defaults to the comma separated
+            PYRC_WARMUP environment variable.
+
+    Returns:
+        The started thread or None if there are no libraries to import.
+    """
+    if names is None:
+        names = os.environ.get("PYRC_WARMUP", "").split(",")
+    names = [name.strip() for name in names if name.strip()]
+    if not names:
+        return None
+
+    def target() -> None:
+        for name in names:
+            # Failures are ignored since they occur again on first use.
+            with contextlib.suppress(Exception):
+                dyport(name)
+
+    thread = threading.Thread(target=target, name="pyrc-warmup", daemon=True)
+    thread.start()
+    return thread
+
+
+def wave_header(dtype: Any, channels: int, rate: int, size: int) -> bytes:
+    """Pack WAV file header for data of the given type and size in bytes."""
+    tag = next(
+        (key[0] for key, value in WAVE_DTYPES.items() if value == dtype.str), None
+    )
+    if tag is None or size > 0xFFFFFFFF - 36:
+        msg = f"Unable to write {dtype} data of {size} bytes to a WAV file."
+        raise ValueError(msg)
+    return struct.pack(
+        "<4sI4s4sIHHIIHH4sI",
+        b"RIFF",
+        size + 36,
+        b"WAVE",
+        b"fmt ",
+        16,
+        tag,
+        channels,
+        rate,
+        rate * channels * dtype.itemsize,
+        channels * dtype.itemsize,
+        dtype.itemsize * 8,
+        b"data",
+        size,
+    )
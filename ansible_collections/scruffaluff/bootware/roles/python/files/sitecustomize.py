@@ -1,10 +1,77 @@
 """Custom utilities for Python.
 
+Builtins are exported as lazy stubs that import their defining module on first
+call to keep interpreter startup fast.
+
 For more information, visit https://docs.python.org/3/library/site.html.
 """
 
-import plotrc
-import pyrc
+# ruff: noqa: ANN401
+
+import builtins
+
+# Quoted types avoid importing the typing module during interpreter startup.
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from typing import Any
+
+EXPORTS = {
+    "aplay": "pyrc",
+    "apropos": "pyrc",
+    "aread": "pyrc",
+    "arec": "pyrc",
+    "astream": "pyrc",
+    "awrite": "pyrc",
+    "cat": "pyrc",
+    "decibel": "pyrc",
+    "doc": "pyrc",
+    "dyport": "pyrc",
+    "dyport_many": "pyrc",
+    "edit": "pyrc",
+    "normalize": "pyrc",
+    "nushell": "pyrc",
+    "page": "pyrc",
+    "pfreq": "plotrc",
+    "pgrid": "plotrc",
+    "phase": "plotrc",
+    "pline": "plotrc",
+    "pspec": "plotrc",
+    "pwave": "plotrc",
+    "shell": "pyrc",
+    "size": "pyrc",
+    "varname": "pyrc",
+}
+
+
+def export() -> None:
+    """Add lazy function stubs to global scope."""
+    for name, module in EXPORTS.items():
+        setattr(builtins, name, stub(name, module))
+
+
+def stub(name: str, module: str) -> "Callable":
+    """Create function that imports module and replaces itself on first call."""
+
+    def call(*args: "Any", **kwargs: "Any") -> "Any":
+        import importlib  # noqa: PLC0415
+        import inspect  # noqa: PLC0415
+
+        importlib.import_module(module).export()
+        function = getattr(builtins, name)
+
+        # Stub adds a frame between the caller and functions that trace
+        # variable names in the calling scope.
+        signature = inspect.signature(function)
+        if "depth" in signature.parameters:
+            bound = signature.bind_partial(*args, **kwargs)
+            if "depth" not in bound.arguments:
+                kwargs["depth"] = signature.parameters["depth"].default + 1
+        return function(*args, **kwargs)
+
+    call.__name__ = call.__qualname__ = name
+    call.__doc__ = f"Import {module} and call its {name} builtin."
+    return call
+
 
-plotrc.export()
-pyrc.export()
+export()
@@ -0,0 +1,146 @@
+"""Benchmarks for Pyrc custom module runtime performance.
+
+Budgets can be overridden with the BENCHMARK_BUDGETS environment variable, such
+as "parse_exprs=100,fullscale_memory=1.5". Wall clock benchmarks are deselected
+by default and run with "pytest -m benchmark".
+"""
+
+# ruff: noqa: E402
+
+import os
+import sys
+import time
+import timeit
+import tracemalloc
+from collections.abc import Callable
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+repo_path = Path(__file__).parents[2]
+sys.path.append(
+    str(repo_path / "ansible_collections/scruffaluff/bootware/roles/python/files")
+)
+
+import pdbrc
+import plotrc
+import pyrc
+
+# Budgets in microseconds per call unless otherwise noted.
+BUDGETS = {
+    # Peak memory as a multiple of input size.
+    "fullscale_memory": 1.1,
+    # Minimum speed up of parallel over serial computation on 4 or more CPUs.
+    "parallel_speedup": 1.5,
+    "parse_exprs": 100.0,
+    # Peak memory as a multiple of output size.
+    "spectrogram_memory": 1.5,
+}
+
+
+def budget(name: str) -> float:
+    """Get benchmark budget."""
+    budgets = dict(BUDGETS)
+    for pair in os.environ.get("BENCHMARK_BUDGETS", "").split(","):
+        if pair.strip():
+            key, value = pair.split("=", maxsplit=1)
+            budgets[key.strip()] = float(value)
+    return budgets[name]
+
+
+def peak_memory(function: Callable[[], object]) -> int:
+    """Get peak traced memory allocated by function in bytes."""
+    tracemalloc.start()
+    try:
+        function()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def test_fullscale_memory() -> None:
+    """Full scale conversion allocates little beyond its output array."""
+    numpy = pyrc.dyport("numpy")
+    signal = numpy.random.default_rng(0).uniform(-1, 1, 2**22).astype("float32")
+    out = numpy.empty_like(signal)
+
+    def unfused() -> object:
+        normalized = signal / numpy.abs(signal).max()
+        return 20 * numpy.log10(numpy.maximum(numpy.abs(normalized), 1e-7))
+
+    baseline = peak_memory(unfused) / signal.nbytes
+    fused = peak_memory(lambda: plotrc.Scale.FullScale(signal)) / signal.nbytes
+    in_place = peak_memory(lambda: pyrc.decibel(signal, out=out)) / signal.nbytes
+    print(
+        f"\nFull scale peak memory unfused {baseline:.2f}x, fused {fused:.2f}x, "
+        f"output array {in_place:.2f}x input size"
+    )
+    assert fused <= budget("fullscale_memory")
+    assert in_place <= budget("fullscale_memory") - 1
+
+
+@pytest.mark.benchmark
+def test_parallel_speedup() -> None:
+    """Spectra of several signals compute faster on a thread pool."""
+    numpy = pyrc.dyport("numpy")
+    rng = numpy.random.default_rng(0)
+    signals = [rng.normal(size=2**20) for _ in range(8)]
+
+    def spectrum(signal: object) -> object:
+        return plotrc.welch(signal, 48_000, segment=2**14)[1]
+
+    spectrum(signals[0])
+    start = time.perf_counter()
+    serial = plotrc.parallel_map(spectrum, signals, workers=1)
+    serial_time = time.perf_counter() - start
+    start = time.perf_counter()
+    parallel = plotrc.parallel_map(spectrum, signals)
+    parallel_time = time.perf_counter() - start
+
+    speedup = serial_time / parallel_time
+    cpus = os.cpu_count() or 1
+    print(f"\nParallel spectra speed up {speedup:.2f}x on {cpus} CPUs")
+    assert len(parallel) == len(serial)
+    if cpus >= 4:
+        assert speedup >= budget("parallel_speedup")
+
+
+@pytest.mark.benchmark
+def test_parse_exprs() -> None:
+    """Debugger command interpolation has small per command overhead."""
+    line = "ls --long %path %{name + '.txt'} %{count * 2} | grep %{pattern.upper()}"
+    locals_ = {"count": 4, "name": "data", "path": "/src", "pattern": "foo"}
+    pdb = SimpleNamespace(
+        curframe=SimpleNamespace(f_globals={}), curframe_locals=locals_
+    )
+    lookup = pdbrc.var_lookup(pdb)
+
+    pyrc.compile_expr.cache_clear()
+    cold = timeit.timeit(lambda: pyrc.parse_exprs(lookup, line), number=1) * 1e6
+    number = 10_000
+    warm = timeit.timeit(lambda: pyrc.parse_exprs(lookup, line), number=number)
+    warm *= 1e6 / number
+    print(f"\nInterpolation cold {cold:.1f} us, warm {warm:.1f} us per command")
+    assert warm <= budget("parse_exprs")
+
+
+def test_spectrogram_memory() -> None:
+    """Block spectrogram allocates little beyond its output array."""
+    numpy, scipy_signal = pyrc.dyport("numpy"), pyrc.dyport("scipy.signal")
+    signal = numpy.random.default_rng(0).normal(size=2**23).astype("float32")
+    transform = scipy_signal.ShortTimeFFT.from_window(
+        "hann", fs=48_000, noverlap=64, nperseg=512
+    )
+    size = transform.f_pts * (transform.p_max(len(signal)) - transform.p_min) * 4
+
+    def unblocked() -> object:
+        return pyrc.decibel(numpy.abs(transform.stft(signal)))
+
+    baseline = peak_memory(unblocked) / size
+    blocked = peak_memory(lambda: plotrc.stft_decibels(transform, signal)) / size
+    print(
+        f"\nSpectrogram peak memory unblocked {baseline:.2f}x, "
+        f"blocked {blocked:.2f}x output size"
+    )
+    assert blocked <= budget("spectrogram_memory")
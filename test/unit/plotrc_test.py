@@ -4,6 +4,9 @@
 
 import sys
 from pathlib import Path
+from unittest import mock
+
+import pytest
 
 repo_path = Path(__file__).parents[2]
 sys.path.append(
@@ -13,8 +16,253 @@ sys.path.append(
 import plotrc
 
 
+def test_grid_spectra() -> None:
+    """Frequency and phase grids compute one transform per signal."""
+    matplotlib = plotrc.dyport("matplotlib")
+    matplotlib.use("Agg")
+    numpy, pyplot = plotrc.dyport("numpy"), plotrc.dyport("matplotlib.pyplot")
+    left, right = numpy.ones(64), numpy.arange(64.0)
+    plotrc.SPECTRA.clear()
+    with mock.patch.object(numpy.fft, "rfft", wraps=numpy.fft.rfft) as rfft:
+        plotrc.grid(left, right, rate=64, show=False)
+        plotrc.frequency(left, rate=64, show=False)
+    assert rfft.call_count == 2
+    pyplot.close("all")
+
+
+def test_lttb() -> None:
+    """Largest triangle buckets keep endpoints and spikes."""
+    numpy = plotrc.dyport("numpy")
+    x = numpy.arange(1_000)
+    y = numpy.zeros(1_000)
+    y[500] = 5
+    x_, y_ = plotrc.lttb(x, y, 20)
+    assert len(x_) == 20
+    assert (x_[0], x_[-1]) == (0, 999)
+    assert 5 in y_
+
+
+def test_minmax() -> None:
+    """Min max decimation keeps extremes of each column in order."""
+    numpy = plotrc.dyport("numpy")
+    x = numpy.arange(11)
+    y = numpy.array([0, 3, -1, 2, 5, 4, -2, 1, 0, 9, -9])
+    x_, y_ = plotrc.minmax(x, y, 2)
+    assert x_.tolist() == [2, 4, 6, 9, 10]
+    assert y_.tolist() == [-1, 5, -2, 9, -9]
+    assert plotrc.minmax(x, y, 10)[1] is y
+
+
+def test_octave_bins() -> None:
+    """Octave bins average spectrum values in bands around 1 kHz."""
+    numpy = plotrc.dyport("numpy")
+    x = numpy.arange(0, 4_001, 250.0)
+    centers, means = plotrc.octave_bins(x, x, "1")
+    assert centers.tolist() == [250, 500, 1_000, 2_000, 4_000]
+    assert means.tolist() == [250, 500, 1_000, 2_125, 3_500]
+
+    x = numpy.linspace(0, 24_000, 1_000_001)
+    centers, means = plotrc.octave_bins(x, numpy.ones_like(x), "1/3")
+    assert len(centers) < 100
+    assert (means == 1).all()
+
+
+def test_parallel_map() -> None:
+    """Parallel plots match serial plots line for line."""
+    matplotlib = plotrc.dyport("matplotlib")
+    matplotlib.use("Agg")
+    numpy, pyplot = plotrc.dyport("numpy"), plotrc.dyport("matplotlib.pyplot")
+    assert plotrc.parallel_map(str, range(5), workers=3) == ["0", "1", "2", "3", "4"]
+
+    rng = numpy.random.default_rng(0)
+    signals = [rng.normal(size=4_096) for _ in range(4)]
+    spectra = [
+        plotrc.parallel_map(
+            lambda signal: plotrc.welch(signal, 48_000, segment=512)[1],
+            signals,
+            workers=workers,
+        )
+        for workers in (1, 4)
+    ]
+    for serial, parallel in zip(*spectra, strict=True):
+        numpy.testing.assert_array_equal(serial, parallel)
+
+    lines = []
+    for workers in (1, 4):
+        plotrc.SPECTRA.clear()
+        figure, axes = pyplot.subplots(nrows=2, squeeze=False)
+        plotrc.frequency(*signals, axes=axes[0], show=False, workers=workers)
+        plotrc.phase(*signals, axes=axes[1], show=False, workers=workers)
+        lines.append(
+            [line.get_ydata() for axis in axes[:, 0] for line in axis.get_lines()]
+        )
+        pyplot.close(figure)
+    for serial, parallel in zip(*lines, strict=True):
+        numpy.testing.assert_array_equal(serial, parallel)
+
+
+def test_pyramid() -> None:
+    """Spectrogram pyramid draws pooled levels and full detail when zoomed."""
+    matplotlib = plotrc.dyport("matplotlib")
+    matplotlib.use("Agg")
+    numpy, pyplot = plotrc.dyport("numpy"), plotrc.dyport("matplotlib.pyplot")
+    data = numpy.arange(3 * 5_001, dtype="float32").reshape(3, 5_001)
+    figure, axis = pyplot.subplots()
+    image = axis.imshow(data, aspect="auto", extent=(0, 5_001, 0, 3))
+    pyramid = plotrc.Pyramid(image, data)
+    assert [level.shape[1] for level in pyramid.levels] == [
+        5_001,
+        2_501,
+        1_251,
+        626,
+        313,
+        157,
+    ]
+    assert pyramid.levels[1][0, -2:].tolist() == [4_999, 5_000]
+
+    axis.callbacks.connect("xlim_changed", pyramid)
+    axis.set_xlim(0, 5_001)
+    assert image.get_array().shape[1] <= 2 * axis.get_window_extent().width
+    axis.set_xlim(100, 200)
+    assert image.get_array()[0].tolist() == list(range(100, 200))
+    assert image.get_extent() == [100, 200, 0, 3]
+    pyplot.close(figure)
+
+
+def test_scale_fullscale() -> None:
+    """Full scale decibels are relative to the signal peak."""
+    numpy = plotrc.dyport("numpy")
+    signal = numpy.array([0.25, -0.5, 0.0], dtype="float32")
+    actual = plotrc.Scale.FullScale(signal)
+    assert actual.dtype == numpy.float32
+    assert actual[:2].tolist() == pytest.approx([-6.0206, 0.0], abs=1e-4)
+    assert actual[2] < -100
+
+
+def test_sigdata_labels() -> None:
+    """Explicit labels override traced names except for dictionary labels."""
+    signal = [0.0, 1.0]
+    datas = plotrc.sigdata([signal, {"y": signal, "label": "dict"}], labels=["a", "b"])
+    assert [data["label"] for data in datas] == ["a", "dict"]
+    with pytest.raises(ValueError, match="Expected 2 labels"):
+        plotrc.sigdata([signal, signal], labels=["a"])
+
+
+def test_sigdata_varnames() -> None:
+    """Default labels are variable names in the calling scope."""
+    left, right = [0.0, 1.0], [1.0, 0.0]
+
+    def plot(*signals: list[float]) -> list[str]:
+        return [data["label"] for data in plotrc.sigdata(signals)]
+
+    labels = plot(left, right, [0.5])
+    assert labels == ["left", "right", "2"]
+
+
+def test_spectrum_cache() -> None:
+    """Spectrum cache detects changed contents and evicts by memory."""
+    numpy = plotrc.dyport("numpy")
+    cache = plotrc.SpectrumCache(limit=2_000)
+    first, second = numpy.zeros(100), numpy.ones(100)
+    spectrum = cache.rfft(first)
+    assert not spectrum.flags.writeable
+    assert cache.rfft(first) is spectrum
+    first[50] = 1
+    assert cache.rfft(first) is not spectrum
+    assert cache.size == 2 * spectrum.nbytes
+
+    cache.rfft(second)
+    assert len(cache.entries) == 2
+    assert cache.size <= cache.limit
+    cache.rfft(numpy.zeros(1_000))
+    assert len(cache.entries) == 2
+
+
 def test_spectrum_ticks() -> None:
     """Spectrum ticks match octaves based on A4."""
     expected = [27.5, 55.0, 110.0, 220.0, 440.0, 880.0, 1760.0, 3520.0, 7040.0, 14080.0]
     ticks = plotrc.spectrum_ticks()[0]
     assert ticks == expected
+
+
+def test_stft_decibels(tmp_path: Path) -> None:
+    """Block spectrogram matches full transform and pools time columns."""
+    numpy, scipy_signal = plotrc.dyport("numpy"), plotrc.dyport("scipy.signal")
+    signal = numpy.random.default_rng(0).normal(size=500_000)
+    transform = scipy_signal.ShortTimeFFT.from_window(
+        "hann", fs=8_000, noverlap=64, nperseg=512
+    )
+    expected = 20 * numpy.log10(
+        numpy.maximum(numpy.abs(transform.stft(signal)), numpy.finfo("float32").eps)
+    )
+    actual = plotrc.stft_decibels(transform, signal)
+    assert actual.dtype == numpy.float32
+    numpy.testing.assert_allclose(actual, expected, atol=1e-3)
+
+    pooled = plotrc.stft_decibels(transform, signal, width=7)
+    indices = numpy.arange(expected.shape[1]) * 7 // expected.shape[1]
+    for column in range(7):
+        numpy.testing.assert_allclose(
+            pooled[:, column], actual[:, indices == column].max(axis=1)
+        )
+
+    shape = (len(signal), 2)
+    stereo = numpy.memmap(tmp_path / "stereo.raw", "float64", "w+", shape=shape)
+    stereo[:, 0], stereo[:, 1] = signal, -0.5 * signal
+    numpy.testing.assert_allclose(
+        plotrc.stft_decibels(transform, stereo),
+        plotrc.stft_decibels(transform, 0.25 * signal),
+        atol=1e-3,
+    )
+
+
+def test_waveform_decimation(tmp_path: Path) -> None:
+    """Waveform points scale with axis width and zooming shows raw samples."""
+    matplotlib = plotrc.dyport("matplotlib")
+    matplotlib.use("Agg")
+    numpy, pyplot = plotrc.dyport("numpy"), plotrc.dyport("matplotlib.pyplot")
+    signal = numpy.sin(numpy.arange(1_000_000) / 100)
+    figure, axes = pyplot.subplots(squeeze=False)
+    plotrc.waveform(signal, axes=axes[0], rate=1_000, show=False)
+    line = axes[0][0].get_lines()[0]
+    width = axes[0][0].get_window_extent().width
+    assert len(line.get_xdata()) <= 2 * width + 2
+
+    axes[0][0].set_xlim(10, 10.05)
+    assert 50 <= len(line.get_xdata()) <= 53
+    assert numpy.diff(line.get_xdata()).max() < 0.0011
+    pyplot.close(figure)
+
+    shape = (len(signal), 2)
+    stereo = numpy.memmap(tmp_path / "stereo.raw", "float64", "w+", shape=shape)
+    stereo[:, 0], stereo[:, 1] = 3 * signal, -signal
+    for method in ("lttb", "minmax"):
+        lines = []
+        for data in (signal, stereo):
+            figure, axes = pyplot.subplots(squeeze=False)
+            plotrc.waveform(data, axes=axes[0], decimate=method, show=False)
+            lines.append(axes[0][0].get_lines()[0].get_ydata())
+            pyplot.close(figure)
+        numpy.testing.assert_allclose(*lines)
+
+
+def test_welch(tmp_path: Path) -> None:
+    """Welch spectrum of memory mapped signals matches SciPy in batches."""
+    numpy, scipy_signal = plotrc.dyport("numpy"), plotrc.dyport("scipy.signal")
+    times = numpy.arange(300_000) / 8_000
+    signal = numpy.memmap(tmp_path / "signal.raw", "float64", "w+", shape=times.shape)
+    signal[:] = 0.5 * numpy.sin(2 * numpy.pi * 1_000 * times)
+
+    freqs, amplitude = plotrc.welch(signal, 8_000, segment=256, overlap=64)
+    assert freqs[amplitude.argmax()] == 1_000
+    assert amplitude.max() == pytest.approx(0.5, rel=1e-3)
+    expected = scipy_signal.welch(
+        signal, 8_000, nperseg=256, noverlap=64, detrend=False, scaling="spectrum"
+    )[1]
+    numpy.testing.assert_allclose(amplitude[1:-1] ** 2, 2 * expected[1:-1])
+
+    shape = (len(times), 2)
+    stereo = numpy.memmap(tmp_path / "stereo.raw", "float64", "w+", shape=shape)
+    stereo[:, 0], stereo[:, 1] = signal, 0.5 * signal
+    actual = plotrc.welch(stereo, 8_000, segment=256, overlap=64)[1]
+    numpy.testing.assert_allclose(actual, 0.75 * amplitude, atol=1e-9)
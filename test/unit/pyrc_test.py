@@ -2,8 +2,14 @@
 
 # ruff: noqa: E402
 
+import builtins
+import contextlib
 import shlex
+import signal
+import subprocess
 import sys
+import wave
+from collections.abc import Callable, Iterator
 from pathlib import Path
 from types import SimpleNamespace
 from typing import Any
@@ -40,6 +46,344 @@ import pyrc
 from pyrc import Expr, Parser
 
 
+class FakeInputStream:
+    """Sounddevice input stream that records fed data on demand."""
+
+    def __init__(
+        self, callback: Callable[..., None], channels: int, **_kwargs: object
+    ) -> None:
+        """Create a new FakeInputStream instance."""
+        self.active = False
+        self.callback = callback
+        self.channels = channels
+
+    def close(self) -> None:
+        """Close stream."""
+        self.active = False
+
+    def feed(self, start: int, frames: int) -> None:
+        """Pass ramp with channel offsets to stream callback."""
+        numpy = pyrc.dyport("numpy")
+        data = numpy.arange(start, start + frames, dtype="float32")
+        indata = data[:, None] + 100 * numpy.arange(self.channels)
+        self.callback(indata, frames, None, None)
+
+    def start(self) -> None:
+        """Start stream."""
+        self.active = True
+
+    def stop(self) -> None:
+        """Stop stream."""
+        self.active = False
+
+
+class FakeOutputStream(FakeInputStream):
+    """Sounddevice output stream that plays back data on demand."""
+
+    def __init__(
+        self,
+        callback: Callable[..., None],
+        channels: int,
+        dtype: str,
+        finished_callback: Callable[[], None],
+        **_kwargs: object,
+    ) -> None:
+        """Create a new FakeOutputStream instance."""
+        super().__init__(callback, channels)
+        self.dtype = dtype
+        self.finished_callback = finished_callback
+
+    def pull(self, frames: int) -> Any:  # noqa: ANN401
+        """Get next output buffer from stream callback."""
+        numpy = pyrc.dyport("numpy")
+        outdata = numpy.full((frames, self.channels), -1, dtype=self.dtype)
+        try:
+            self.callback(outdata, frames, None, None)
+        except sys.modules["sounddevice"].CallbackStop:
+            self.finished_callback()
+        return outdata
+
+
+@contextlib.contextmanager
+def fake_sounddevice() -> Iterator[SimpleNamespace]:
+    """Replace sounddevice module and dynamic import cache with a fake."""
+    sounddevice = SimpleNamespace(
+        CallbackStop=type("CallbackStop", (Exception,), {}),
+        InputStream=FakeInputStream,
+        OutputStream=FakeOutputStream,
+        play=Mock(),
+        stop=Mock(),
+        query_devices=lambda kind: {"default_samplerate": 8.0, "kind": kind},
+    )
+    pyrc.dyport.cache_clear()
+    try:
+        with (
+            mock.patch.dict(sys.modules, {"sounddevice": sounddevice}),
+            mock.patch.object(sys, "meta_path", [*sys.meta_path]),
+        ):
+            yield sounddevice
+    finally:
+        pyrc.dyport.cache_clear()
+
+
+def test_aplay_chunked(tmp_path: Path) -> None:
+    """Memory mapped playback streams blocks from offset to end."""
+    numpy = pyrc.dyport("numpy")
+    data = numpy.memmap(tmp_path / "audio.raw", dtype="int16", mode="w+", shape=10)
+    data[:] = numpy.arange(10)
+    with fake_sounddevice():
+        player = pyrc.aplay(data, rate=8, map=[2], offset=-7)
+        assert player is not None
+        assert player.stream.dtype == "int16"
+        assert player.stream.pull(4).tolist() == [[0, 3], [0, 4], [0, 5], [0, 6]]
+        assert not player.finished.is_set()
+        assert player.stream.pull(4)[:, 1].tolist() == [7, 8, 9, 0]
+        assert player.finished.is_set()
+
+
+def test_aplay_list() -> None:
+    """Sequences are converted to arrays before playback."""
+    with fake_sounddevice() as sounddevice:
+        assert pyrc.aplay([0.0, 0.1], rate=8000) is None
+        assert sounddevice.play.call_args.args[0].tolist() == [0.0, 0.1]
+        assert sounddevice.play.call_args.kwargs["samplerate"] == 8000
+        with pytest.raises(ValueError, match="requires chunked"):
+            pyrc.aplay([0.0, 0.1], rate=8000, offset=1, chunked=False)
+        sounddevice.play.assert_called_once()
+        player = pyrc.aplay([0.0, 0.1], rate=8000, chunked=True)
+        assert player is not None
+        assert player.stream.pull(2)[:, 0].tolist() == pytest.approx([0.0, 0.1])
+
+
+def test_aplay_loop() -> None:
+    """Looped chunked playback wraps around and small arrays play directly."""
+    numpy = pyrc.dyport("numpy")
+    data = numpy.arange(6, dtype="float64")
+    with fake_sounddevice() as sounddevice:
+        assert pyrc.aplay(data) is None
+        sounddevice.play.assert_called_once()
+        player = pyrc.aplay(data, loop=True, chunked=True)
+        assert player is not None
+        assert player.stream.dtype == "float32"
+        assert player.stream.pull(4)[:, 0].tolist() == [0, 1, 2, 3]
+        assert player.stream.pull(4)[:, 0].tolist() == [4, 5, 0, 1]
+        assert not player.finished.is_set()
+        pyrc.aplay(data, chunked=False)
+        assert player.finished.is_set()
+
+
+def test_apropos(tmp_path: Path) -> None:
+    """Apropos searches docstrings and reuses persisted index entries."""
+    (tmp_path / "pyrc_docs.py").write_text(
+        '''"""Fake module."""
+
+
+def frobnicate(count: int) -> None:
+    """Twist the widget."""
+'''
+    )
+    with (
+        mock.patch.object(Path, "home", return_value=tmp_path),
+        mock.patch.object(sys, "path", [str(tmp_path), *sys.path]),
+        mock.patch.object(pyrc, "page") as page,
+    ):
+        pyrc.apropos("WIDGET twist", modules=["pyrc_docs"])
+        with mock.patch.object(pyrc, "index_module") as index_module:
+            pyrc.apropos("widget", modules=["pyrc_docs"])
+        index_module.assert_not_called()
+
+    expected = ["pyrc_docs.frobnicate(count: int) -> None\n    Twist the widget.\n"]
+    assert list(page.call_args.args[0]) == expected
+    assert (tmp_path / ".config/pyrc/apropos.json").exists()
+
+
+def test_aread(tmp_path: Path) -> None:
+    """Aread memory maps PCM data and rejects unsupported sample widths."""
+    numpy = pyrc.dyport("numpy")
+    expected = numpy.arange(-6, 6, dtype="<i2").reshape(-1, 2)
+    path = tmp_path / "stereo.wav"
+    with wave.open(str(path), "wb") as file:
+        file.setnchannels(2)
+        file.setsampwidth(2)
+        file.setframerate(8_000)
+        file.writeframes(expected.tobytes())
+
+    data = pyrc.aread(path)
+    assert isinstance(data, numpy.memmap)
+    assert data.rate == 8_000
+    assert data.tolist() == expected.tolist()
+
+    with wave.open(str(path), "wb") as file:
+        file.setnchannels(1)
+        file.setsampwidth(3)
+        file.setframerate(8_000)
+        file.writeframes(bytes(12))
+    with pytest.raises(ValueError, match="24 bit"):
+        pyrc.aread(path)
+
+
+def test_aread_truncated(tmp_path: Path) -> None:
+    """Aread clamps data sizes to the file and rejects short headers."""
+    numpy = pyrc.dyport("numpy")
+    path = tmp_path / "audio.wav"
+    pyrc.awrite(path, numpy.arange(8, dtype="int16"), rate=8)
+    content = path.read_bytes()
+    # Streaming writers leave a placeholder size until recording finishes.
+    path.write_bytes(content[:40] + b"\xff\xff\xff\xff" + content[44:49])
+    assert pyrc.aread(path).tolist() == [0, 1]
+    path.write_bytes(content[:44])
+    assert pyrc.aread(path).tolist() == []
+
+    for size, match in [(8, "not a WAV"), (30, "invalid format"), (40, "no data")]:
+        path.write_bytes(content[:size])
+        with pytest.raises(ValueError, match=match):
+            pyrc.aread(path)
+
+
+def test_awrite(tmp_path: Path) -> None:
+    """Awrite streams arrays and block iterables to readable WAV files."""
+    numpy = pyrc.dyport("numpy")
+    path = tmp_path / "mono.wav"
+    expected = numpy.arange(10, dtype="int16")
+    pyrc.awrite(path, expected, rate=4, blocksize=3)
+    with wave.open(str(path), "rb") as file:
+        assert file.getparams()[:4] == (1, 2, 4, 10)
+        assert file.readframes(10) == expected.tobytes()
+
+    blocks = (numpy.full((4, 2), index, dtype="float32") for index in range(3))
+    pyrc.awrite(path, blocks, rate=4)
+    data = pyrc.aread(path)
+    assert (data.shape, data.dtype.str, data.rate) == ((12, 2), "<f4", 4)
+    pyrc.awrite(tmp_path / "copy.wav", data)
+    assert (tmp_path / "copy.wav").read_bytes() == path.read_bytes()
+
+
+def test_awrite_error(tmp_path: Path) -> None:
+    """Awrite rejects unsupported data types before writing samples."""
+    numpy = pyrc.dyport("numpy")
+    path = tmp_path / "audio.wav"
+    written: list[int] = []
+
+    def blocks() -> Iterator[Any]:
+        for index in range(2):
+            written.append(index)
+            yield numpy.arange(4)
+
+    with pytest.raises(ValueError, match="int64"):
+        pyrc.awrite(path, blocks(), rate=4)
+    assert written == [0]
+    assert not path.exists()
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        ([1, 2], "[1, 2]"),
+        (list(range(1_000)), "[0, 1, 2, 3, 4, 5, ...]"),
+        ("a" * 100, repr("a" * 100)),
+        ({"a": list(range(1_000_000))}, "{'a': [0, ...]}"),
+        (
+            [list(range(200))] * 50,
+            "[[0, ...], [0, ...], [0, ...], [0, ...], [0, ...], [0, ...], ...]",
+        ),
+        ({"a": [[[1]]]}, "{'a': [[[...]]]}"),
+        (
+            SimpleNamespace(
+                dtype="float32",
+                max=lambda: 1.0,
+                min=lambda: -1.0,
+                shape=[10_000, 2],
+                size=20_000,
+            ),
+            "SimpleNamespace(shape=(10000, 2), dtype=float32, min=-1.0, max=1.0)",
+        ),
+        (
+            {"a": SimpleNamespace(dtype="int8", shape=[2], size=2)},
+            "{'a': SimpleNamespace(shape=(2,), dtype=int8)}",
+        ),
+    ],
+)
+def test_bounded_repr(value: object, expected: str) -> None:
+    """Large values are summarized or truncated."""
+    actual = pyrc.bounded_repr(value, limit=6)
+    assert actual == expected
+
+
+def test_catalog() -> None:
+    """Catalog generates one entry per matching attribute."""
+    object_ = SimpleNamespace(data=dict.fromkeys(range(1_000), 0), path="src")
+    entries = pyrc.catalog(object_, regex="^d")
+    assert next(entries).startswith("SimpleNamespace.data = {0: 0, 1: 0,")
+    assert list(entries) == []
+
+
+def test_chunks() -> None:
+    """Chunks cover the first axis with rows of about the requested size."""
+    numpy = pyrc.dyport("numpy")
+    indices = list(pyrc.chunks(numpy.zeros((10, 3)), size=12))
+    assert indices == [slice(0, 4), slice(4, 8), slice(8, 12)]
+    assert list(pyrc.chunks(numpy.zeros(()))) == [...]
+
+
+def test_commands_lldb() -> None:
+    """LLDB registers shared and LLDB commands from the registry."""
+    debugger = MagicMock()
+    with mock.patch.object(pyrc, "warmup"):
+        lldbrc.__lldb_init_module(debugger, {})  # noqa: SLF001
+    handle = debugger.GetCommandInterpreter.return_value.HandleCommand
+    commands = [call.args[0].split()[-2:] for call in handle.call_args_list]
+    assert ["lldbrc.run_nushell", "nu"] in commands
+    assert ["lldbrc.run_py", "py"] in commands
+    assert all(name != "cat" for _, name in commands)
+
+
+def test_commands_pdb() -> None:
+    """PDB binds command aliases that reuse prebuilt parsers."""
+    pdb = type("Pdb", (), {"_complete_expression": "complete"})
+    with mock.patch.dict(vars(builtins)), mock.patch.object(pyrc, "warmup"):
+        pdbrc.setup(pdb)
+    assert pdb.do_nu is pdb.do_nushell
+    assert pdb.complete_cat == "complete"
+    assert not hasattr(pdb, "do_pytype")
+
+    self = SimpleNamespace(
+        curframe=SimpleNamespace(f_globals={}), curframe_locals={"val": "src"}
+    )
+    parser = pyrc.COMMANDS["nushell"].parser
+    with mock.patch.object(pyrc, "nushell") as nushell:
+        pdb.do_nu(self, "--cwd work ls %val")
+    nushell.assert_called_once_with("ls src", cwd="work")
+    assert pyrc.COMMANDS["nushell"].parser is parser
+
+
+def test_decibel() -> None:
+    """Decibel conversion keeps float type and supports in place output."""
+    numpy = pyrc.dyport("numpy")
+    signal = numpy.linspace(-2, 2, 1_000_001, dtype="float32")
+    expected = 20 * numpy.log10(
+        numpy.maximum(numpy.abs(signal / 2), numpy.finfo("float32").eps)
+    )
+    actual = pyrc.decibel(signal, reference=2)
+    assert actual.dtype == numpy.float32
+    numpy.testing.assert_allclose(actual, expected, rtol=1e-6)
+    assert pyrc.decibel(signal, out=signal, reference=2) is signal
+    numpy.testing.assert_allclose(signal, expected, rtol=1e-6)
+    assert pyrc.decibel(numpy.array([0, 10], dtype="int16")).tolist() == [
+        pytest.approx(20 * numpy.log10(numpy.finfo("float32").eps)),
+        20.0,
+    ]
+    spectrum = numpy.fft.rfft(numpy.ones(8, dtype="float32"))
+    actual = pyrc.decibel(spectrum, reference=8)
+    assert actual.dtype == numpy.float32
+    assert actual[0] == pytest.approx(0.0)
+    assert pyrc.decibel(numpy.array([3 + 4j, 1j])).tolist() == pytest.approx(
+        [
+            20 * numpy.log10(5),
+            0.0,
+        ]
+    )
+
+
 @pytest.mark.parametrize(
     ("line", "count", "expected"),
     [
@@ -56,6 +400,25 @@ def test_drop_tokens(line: str, count: int, expected: str) -> None:
     assert actual == expected
 
 
+def test_dyport_finder(tmp_path: Path) -> None:
+    """Dyport finder only serves indexed modules and their metadata."""
+    (tmp_path / "pyrc_fake").mkdir()
+    (tmp_path / "pyrc_fake/__init__.py").write_text("value = 1\n")
+    (tmp_path / "pyrc_fake_single.py").write_text("value = 2\n")
+    (tmp_path / "pyrc_fake-1.0.dist-info").mkdir()
+    (tmp_path / "pyrc_fake-1.0.dist-info/METADATA").write_text(
+        "Name: pyrc-fake\nVersion: 1.0\n"
+    )
+
+    finder = pyrc.DyportFinder(str(tmp_path))
+    assert sorted(finder.index) == ["pyrc_fake", "pyrc_fake_single"]
+    assert finder.find_spec("json") is None
+    assert finder.find_spec("pyrc_fake") is not None
+    assert finder.find_spec("pyrc_fake_single") is not None
+    [distribution] = finder.find_distributions(SimpleNamespace(name="pyrc-fake"))
+    assert distribution.version == "1.0"
+
+
 @pytest.mark.parametrize(
     ("line", "expected"),
     [
@@ -70,6 +433,108 @@ def test_find_exprs(line: str, expected: list[Expr]) -> None:
     assert actual == expected
 
 
+def test_footprint_arrays() -> None:
+    """Footprint counts array buffers once across views."""
+    numpy = pyrc.dyport("numpy")
+    array = numpy.zeros(1_000_000, dtype="uint8")
+    view = array[:]
+    assert 1_000_000 < pyrc.footprint(view) < 1_010_000
+    assert 1_000_000 < pyrc.footprint([array, view]) < 1_010_000
+
+
+def test_footprint_deep() -> None:
+    """Footprint handles graphs deeper than the recursion limit."""
+    nested: list[object] = []
+    for _ in range(sys.getrecursionlimit() * 10):
+        nested = [nested]
+    assert pyrc.footprint(nested) > sys.getrecursionlimit() * 10 * sys.getsizeof([])
+
+
+def test_footprint_mocks() -> None:
+    """Footprint ignores attributes created on demand or failing to load."""
+
+    class Broken:
+        @property
+        def __dict__(self) -> dict[str, object]:  # type: ignore[override]
+            raise RuntimeError
+
+    for object_ in (Mock(), MagicMock(), Broken()):
+        assert pyrc.footprint(object_) > 0
+
+
+def test_normalize() -> None:
+    """Normalization scales by peak absolute value in chunks."""
+    numpy = pyrc.dyport("numpy")
+    signal = numpy.arange(-4, 3, dtype="int16").reshape(-1, 1)
+    assert pyrc.normalize(signal)[:, 0].tolist() == [
+        -1,
+        -0.75,
+        -0.5,
+        -0.25,
+        0,
+        0.25,
+        0.5,
+    ]
+    signal = numpy.array([0.5, -4.0, 2.0], dtype="float32")
+    assert pyrc.normalize(signal, out=signal) is signal
+    assert signal.tolist() == [0.125, -1.0, 0.5]
+    zeros = numpy.zeros(3)
+    assert pyrc.normalize(zeros) is zeros
+    actual = pyrc.normalize(numpy.array([3 + 4j, 1j]))
+    numpy.testing.assert_allclose(actual, [0.6 + 0.8j, 0.2j])
+    assert pyrc.peak(numpy.array([3 + 4j, -1j], dtype="complex64")) == 5.0
+    assert pyrc.peak(numpy.array([-128, 1], dtype="int8")) == 128.0
+    signal = numpy.array([-32768, 16384], dtype="int16")
+    assert pyrc.normalize(signal).tolist() == [-1.0, 0.5]
+
+
+@pytest.mark.parametrize(
+    ("error", "script", "code"),
+    [
+        (KeyboardInterrupt, "#!/bin/sh\nsleep 60\n", -signal.SIGTERM),
+        (ValueError, "#!/bin/sh\ncat > /dev/null\n", 0),
+    ],
+)
+def test_page_error(
+    tmp_path: Path, error: type[BaseException], script: str, code: int
+) -> None:
+    """Pager is reaped when chunk generation fails."""
+    pager = tmp_path / "pager"
+    pager.write_text(script)
+    pager.chmod(0o755)
+    processes: list[subprocess.Popen[str]] = []
+    popen_ = subprocess.Popen
+
+    def chunks() -> Iterator[str]:
+        yield "line\n"
+        raise error
+
+    def popen(*args: Any, **kwargs: Any) -> subprocess.Popen[str]:
+        processes.append(popen_(*args, **kwargs))
+        return processes[-1]
+
+    with (
+        mock.patch.dict("os.environ", {"PAGER": str(pager)}),
+        mock.patch("subprocess.Popen", side_effect=popen),
+        pytest.raises(error),
+    ):
+        pyrc.page(chunks())
+    assert processes[0].returncode == code
+
+
+def test_page_quit() -> None:
+    """Pager may exit before reading all chunks."""
+    with mock.patch.dict("os.environ", {"PAGER": "true"}):
+        pyrc.page("line\n" for _ in range(100_000))
+
+
+def test_page_stream(capfd: pytest.CaptureFixture[str]) -> None:
+    """Pager receives streamed chunks."""
+    with mock.patch.dict("os.environ", {"PAGER": "cat"}):
+        pyrc.page(f"{index}\n" for index in range(3))
+    assert capfd.readouterr().out == "0\n1\n2\n"
+
+
 @pytest.mark.parametrize(
     ("line", "locals_", "expected"),
     [
@@ -110,6 +575,57 @@ def test_parse_line(line: str, expected: str) -> None:
     assert rest == expected
 
 
+def test_prefetch(tmp_path: Path) -> None:
+    """Prefetch installs all missing packages with one command."""
+    with (
+        mock.patch.object(Path, "home", return_value=tmp_path),
+        mock.patch.object(sys, "meta_path", [*sys.meta_path]),
+        mock.patch("importlib.util.find_spec", return_value=None),
+        mock.patch("subprocess.run") as run,
+    ):
+        pyrc.prefetch(["missing_b.sub", "missing_a", "missing_b", "sys"])
+    run.assert_called_once()
+    command = run.call_args.args[0]
+    assert command[-2:] == ["missing_a", "missing_b"]
+
+
+def test_recorder_blocks() -> None:
+    """Recorder yields ordered blocks and skips overwritten frames."""
+    with fake_sounddevice(), pyrc.astream(seconds=2, blocksize=4) as recorder:
+        recorder.stream.feed(0, 8)
+        blocks = recorder.blocks(timeout=0)
+        assert next(blocks)[:, 0].tolist() == [0, 1, 2, 3]
+        recorder.stream.feed(8, 20)
+        assert next(blocks)[:, 0].tolist() == [12, 13, 14, 15]
+        assert recorder.dropped == 8
+        assert [block[0, 0] for block in blocks] == [16, 20, 24]
+    assert not recorder.active
+    assert len(list(recorder.blocks())) == 4
+
+
+def test_recorder_snapshot() -> None:
+    """Recorder snapshots recent mapped channels with bounded memory."""
+    with fake_sounddevice():
+        recorder = pyrc.astream(seconds=2, blocksize=4, map=[3, 1])
+        for start in range(0, 1_000, 10):
+            recorder.stream.feed(start, 10)
+        assert recorder.buffer.shape == (16, 2)
+        assert recorder.snapshot(0.5)[:, 0].tolist() == [1196, 1197, 1198, 1199]
+        assert recorder.snapshot(0.5)[:, 1].tolist() == [996, 997, 998, 999]
+        assert len(recorder.snapshot()) == 16
+        recorder.stream.feed(1_000, 100)
+        assert recorder.snapshot()[0, 1] == 1_084
+
+
+def test_size() -> None:
+    """Size reports largest matching variables first."""
+    variables = {"big": list(range(1_000)), "small": [1], "skip": list(range(9))}
+    with mock.patch.object(pyrc, "page") as page:
+        pyrc.size(variables, regex="^(big|small)$")
+    lines = list(page.call_args.args[0])
+    assert [line.split()[-1] for line in lines] == ["big", "small", "total"]
+
+
 @pytest.mark.parametrize(
     ("type_"),
     [
@@ -186,3 +702,112 @@ def test_to_py_string(type_: str) -> None:
     pyvar = lldbrc.to_py(variable)
     actual = type(pyvar)
     assert actual is str
+
+
+@pytest.mark.parametrize(
+    ("files", "expected"),
+    [
+        ([], ["numpy"]),
+        (["venv/python{version}.lock"], ["--require-hashes", "--requirements"]),
+        (
+            ["venv/python{version}.lock", "wheels/"],
+            [
+                "--offline",
+                "--no-index",
+                "--find-links",
+                "--require-hashes",
+                "--requirements",
+            ],
+        ),
+    ],
+)
+def test_uv_install(tmp_path: Path, files: list[str], expected: list[str]) -> None:
+    """Uv install uses local wheelhouse and lockfile if available."""
+    version = f"{sys.version_info.major}.{sys.version_info.minor}"
+    for file in files:
+        path = tmp_path / ".config/pyrc" / file.format(version=version)
+        if file.endswith("/"):
+            path.mkdir(parents=True)
+        else:
+            path.parent.mkdir(parents=True)
+            path.touch()
+
+    with (
+        mock.patch.object(Path, "home", return_value=tmp_path),
+        mock.patch.object(sys, "meta_path", [*sys.meta_path]),
+        mock.patch("importlib.util.find_spec", side_effect=[None, Mock()]),
+        mock.patch("subprocess.run") as run,
+    ):
+        pyrc.uv_install(["numpy"])
+    command = run.call_args.args[0]
+    assert [arg for arg in command if arg in set(expected)] == expected
+    assert ("numpy" in command) == ("numpy" in expected)
+
+
+def test_uv_install_lockfile(tmp_path: Path) -> None:
+    """Uv install rejects unverified wheels and packages missing from lockfile."""
+    version = f"{sys.version_info.major}.{sys.version_info.minor}"
+    config = tmp_path / ".config/pyrc"
+    (config / "wheels").mkdir(parents=True)
+    with (
+        mock.patch.object(Path, "home", return_value=tmp_path),
+        mock.patch.object(sys, "meta_path", [*sys.meta_path]),
+        mock.patch("importlib.util.find_spec", return_value=None),
+        mock.patch("subprocess.run") as run,
+    ):
+        with pytest.raises(FileNotFoundError, match="requires lockfile"):
+            pyrc.uv_install(["numpy"])
+        run.assert_not_called()
+
+        (config / f"venv/python{version}.lock").touch()
+        with pytest.raises(ModuleNotFoundError, match=f"python{version}.lock"):
+            pyrc.uv_install(["numpy"])
+        run.assert_called_once()
+
+
+def test_uv_install_skip(tmp_path: Path) -> None:
+    """Uv install skips packages installed while waiting for the lock."""
+    version = f"{sys.version_info.major}.{sys.version_info.minor}"
+    with (
+        mock.patch.object(Path, "home", return_value=tmp_path),
+        mock.patch.object(sys, "meta_path", [*sys.meta_path]),
+        mock.patch("subprocess.run") as run,
+    ):
+        pyrc.uv_install(["json", "sys"])
+    run.assert_not_called()
+    assert (tmp_path / f".config/pyrc/venv/python{version}/.lock").exists()
+
+
+def test_varnames() -> None:
+    """Variable names resolve from local and global scope in one pass."""
+    first, second = [1], [2]
+
+    def label(*vars_: object) -> list[str]:
+        return pyrc.varnames(vars_, ["a", "b", "c"])
+
+    names = label(first, second, [3])
+    assert names == ["first", "second", "c"]
+    names = label(pyrc, first, second)
+    assert names == ["pyrc", "first", "second"]
+
+
+def test_warmup() -> None:
+    """Warmup imports libraries from environment on a background thread."""
+    env = {"PYRC_WARMUP": "numpy, scipy.signal,"}
+    with (
+        mock.patch.dict("os.environ", env),
+        mock.patch.object(pyrc, "dyport") as dyport,
+    ):
+        thread = pyrc.warmup()
+        assert thread is not None
+        thread.join()
+    assert [call.args[0] for call in dyport.call_args_list] == [
+        "numpy",
+        "scipy.signal",
+    ]
+
+
+def test_warmup_disabled() -> None:
+    """Warmup is disabled without libraries."""
+    with mock.patch.dict("os.environ", {"PYRC_WARMUP": ""}):
+        assert pyrc.warmup() is None
@@ -0,0 +1,58 @@
+"""Tests for Python site customization."""
+
+# ruff: noqa: E402
+
+import builtins
+import os
+import runpy
+import subprocess
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+from unittest import mock
+
+repo_path = Path(__file__).parents[2]
+files_path = repo_path / "ansible_collections/scruffaluff/bootware/roles/python/files"
+sys.path.append(str(files_path))
+
+import plotrc
+import pyrc
+
+
+def test_exports_match() -> None:
+    """Lazy stubs cover every builtin exported by custom modules."""
+    namespace = SimpleNamespace()
+    with mock.patch.dict(vars(builtins)):
+        exports = runpy.run_path(str(files_path / "sitecustomize.py"))["EXPORTS"]
+    for module in (plotrc, pyrc):
+        with mock.patch.object(module, "builtins", namespace):
+            module.export()
+    assert sorted(exports) == sorted(vars(namespace))
+
+
+def test_lazy_import() -> None:
+    """Site customization defers custom module imports until first call."""
+    script = """
+import sys
+
+import matplotlib
+
+matplotlib.use("Agg")
+
+def label(value):
+    return varname(value)
+
+signal = []
+assert "pyrc" not in sys.modules
+assert label(signal) == "signal"
+assert "pyrc" in sys.modules
+
+left, right = [0.0, 1.0], [1.0, 0.0]
+assert "plotrc" not in sys.modules
+pgrid(left, right, plots=["line"], show=False)
+figure = sys.modules["matplotlib.pyplot"].gcf()
+labels = [line.get_label() for line in figure.axes[0].get_lines()]
+assert labels == ["left", "right"], labels
+"""
+    env = {**os.environ, "PYTHONPATH": str(files_path)}
+    subprocess.run([sys.executable, "-c", script], check=True, env=env)
@@ -0,0 +1,105 @@
+"""Benchmarks for Python interpreter and debugger startup.
+
+Budgets are cumulative import times in milliseconds and can be overridden with
+the IMPORT_BUDGETS environment variable, such as "pyrc=40,pdbrc=80". Tests are
+deselected by default and run with "pytest -m benchmark".
+"""
+
+import os
+import re
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+repo_path = Path(__file__).parents[2]
+files_path = repo_path / "ansible_collections/scruffaluff/bootware/roles/python/files"
+
+BUDGETS = {
+    "pdbrc": 100.0,
+    "plotrc": 75.0,
+    "pyrc": 50.0,
+    "sitecustomize": 5.0,
+}
+IMPORT_TIME_RE = re.compile(r"^import time:\s+\d+\s+\|\s+(\d+)\s+\|\s+(\S+)$")
+RUNS = 5
+
+pytestmark = pytest.mark.benchmark
+
+
+def budget(module: str) -> float:
+    """Get import time budget for module."""
+    budgets = dict(BUDGETS)
+    for pair in os.environ.get("IMPORT_BUDGETS", "").split(","):
+        if pair.strip():
+            key, value = pair.split("=", maxsplit=1)
+            budgets[key.strip()] = float(value)
+    return budgets[module]
+
+
+def import_times(
+    args: list[str], env: dict[str, str], input_: str = ""
+) -> dict[str, float]:
+    """Get best cumulative import times in milliseconds across several runs."""
+    times: dict[str, float] = {}
+    for _ in range(RUNS):
+        process = subprocess.run(
+            [sys.executable, "-X", "importtime", *args],
+            capture_output=True,
+            check=True,
+            env=env,
+            input=input_,
+            text=True,
+        )
+        for line in process.stderr.splitlines():
+            match = IMPORT_TIME_RE.match(line)
+            if match:
+                name, time = match[2], int(match[1]) / 1_000
+                times[name] = min(time, times.get(name, time))
+    return times
+
+
+def report(title: str, times: dict[str, float], count: int = 10) -> None:
+    """Print slowest cumulative import times."""
+    print(f"\n{title}")
+    for name, time in sorted(times.items(), key=lambda item: -item[1])[:count]:
+        print(f"  {time:8.2f} ms  {name}")
+
+
+def test_debugger_startup(tmp_path: Path) -> None:
+    """Debugger settings load within import time budget."""
+    config = tmp_path / ".config"
+    config.mkdir()
+    (config / "pyrc").symlink_to(files_path, target_is_directory=True)
+    (tmp_path / ".pdbrc").write_text((files_path / "pdbrc").read_text())
+    script = tmp_path / "script.py"
+    script.write_text("value = 1\n")
+
+    env = {**os.environ, "HOME": str(tmp_path), "USERPROFILE": str(tmp_path)}
+    times = import_times(["-m", "pdb", str(script)], env, input_="continue\n")
+    report("Debugger startup", times)
+    assert times["pdbrc"] <= budget("pdbrc")
+
+
+@pytest.mark.parametrize("module", ["pdbrc", "plotrc", "pyrc"])
+def test_module_import(module: str) -> None:
+    """Custom modules import within budget."""
+    env = {**os.environ, "PYTHONPATH": str(files_path)}
+    times = import_times(["-c", f"import {module}"], env)
+    report(f"Import {module}", times)
+    assert times[module] <= budget(module)
+
+
+def test_site_startup() -> None:
+    """Site customization adds little time to interpreter startup."""
+    env = {key: value for key, value in os.environ.items() if key != "PYTHONPATH"}
+    baseline = import_times(["-c", "pass"], env)
+    times = import_times(["-c", "pass"], {**env, "PYTHONPATH": str(files_path)})
+    report("Interpreter startup with site customization", times)
+
+    # Site startup difference is reported but not asserted since it includes
+    # noise from unrelated modules.
+    overhead = times["site"] - baseline["site"]
+    print(f"  {overhead:8.2f} ms  site customization overhead")
+    assert times["sitecustomize"] <= budget("sitecustomize")